@@ -0,0 +1,19 @@
+"""
+Purpose: Shared pytest configuration for the design linter test suite
+Scope: Import path setup for every test module under test/unit_test/tools/design_linters
+Overview: Makes the design_linters package importable from the repository's tools directory so
+    that test modules can import it directly, whether pytest is launched from the repository
+    root, from this directory, or through a module's __main__ entry point. The path is derived
+    from this file's location and inserted once per session instead of once per test module.
+Dependencies: sys, pathlib
+Exports: No fixtures; configures sys.path at import time
+Interfaces: Loaded automatically by pytest before collecting test modules in this directory
+Implementation: Inserts the tools directory at the front of sys.path when it is not already present
+"""
+
+import sys
+from pathlib import Path
+
+_TOOLS = str(Path(__file__).resolve().parents[4] / "tools")
+if _TOOLS not in sys.path:
+    sys.path.insert(0, _TOOLS)
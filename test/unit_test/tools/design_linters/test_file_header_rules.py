@@ -17,13 +17,14 @@ Implementation: Uses pytest fixtures and parameterized tests for comprehensive c
 """
 
 import ast
-import tempfile
-from pathlib import Path
 
 import pytest
 from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.style.file_header_rules import FileHeaderRule
 
+# Header checks read file_content; contexts only need some tree, so they share this one
+_EMPTY_TREE = ast.parse("")
+
 
 class TestFileHeaderRule:
     """Test suite for FileHeaderRule."""
@@ -39,7 +40,7 @@ class TestFileHeaderRule:
         ctx = LintContext()
         ctx.file_path = "test_file.py"  # Test files should have headers too
         ctx.file_content = ""
-        ctx.ast_tree = ast.parse("")
+        ctx.ast_tree = _EMPTY_TREE
         return ctx
 
     def test_python_file_with_complete_header(self, rule, context):
@@ -173,7 +174,7 @@ export default function UserProfile() {
         context.file_path = "test_file.tsx"
         context.file_content = content
         # For TypeScript files, we still need an AST (even if minimal)
-        context.ast_tree = ast.parse("")
+        context.ast_tree = _EMPTY_TREE
 
         violations = rule.check(context)
 
@@ -194,7 +195,7 @@ Content starts here...
 """
         context.file_path = "test_file.md"
         context.file_content = content
-        context.ast_tree = ast.parse("")
+        context.ast_tree = _EMPTY_TREE
 
         violations = rule.check(context)
 
@@ -207,7 +208,7 @@ Content starts here...
         context = LintContext()
         context.file_path = "test_something.py"
         context.file_content = "# No header needed for test files"
-        context.ast_tree = ast.parse("")
+        context.ast_tree = _EMPTY_TREE
 
         violations = rule.check(context)
 
@@ -242,7 +243,7 @@ Dependencies: Bootstrap CSS, Vue.js framework
 """
         context.file_path = "test_file.html"
         context.file_content = content
-        context.ast_tree = ast.parse("")
+        context.ast_tree = _EMPTY_TREE
 
         violations = rule.check(context)
 
@@ -260,7 +261,7 @@ on: [push, pull_request]
 """
         context.file_path = "test_file.yml"
         context.file_content = content
-        context.ast_tree = ast.parse("")
+        context.ast_tree = _EMPTY_TREE
 
         violations = rule.check(context)
 
@@ -356,7 +357,7 @@ def test_function():
         context = LintContext()
         context.file_path = f"test_file{file_ext}"
         context.file_content = f"{header_start}\nPurpose: Test\n"
-        context.ast_tree = ast.parse("")
+        context.ast_tree = _EMPTY_TREE
 
         violations = rule.check(context)
 
@@ -13,12 +13,15 @@ Implementation: Comprehensive test coverage using mocked file paths and contexts
 
 import ast
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-import pytest
 from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.organization.file_placement_rules import FileOrganizationRule
 
+_PROJECT_ROOT = Path("/project")
+# The rule only reads the module node, so every check shares one parsed tree
+_MODULE_NODE = ast.parse("# Test")
+
 
 class TestFileOrganizationRule:
     """Test suite for FileOrganizationRule."""
@@ -48,10 +51,10 @@ class TestFileOrganizationRule:
         """Test that allowed root files don't trigger violations."""
         allowed_files = ["setup.py", "conftest.py", "manage.py"]
 
-        for filename in allowed_files:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for filename in allowed_files:
                 context = self.create_context(f"/project/{filename}")
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 assert len(violations) == 0, f"File {filename} should be allowed in root"
 
@@ -64,10 +67,10 @@ class TestFileOrganizationRule:
             "debug_orchestrator.py",
         ]
 
-        for filename in debug_files:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for filename in debug_files:
                 context = self.create_context(f"/project/{filename}")
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
 
                 assert len(violations) == 1, f"Debug file {filename} should trigger violation"
@@ -80,10 +83,10 @@ class TestFileOrganizationRule:
         """Test detection of temporary files in root directory."""
         temp_files = ["tmp_file.py", "temp_test.py", "temp-data.py"]
 
-        for filename in temp_files:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for filename in temp_files:
                 context = self.create_context(f"/project/{filename}")
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
 
                 assert len(violations) == 1, f"Temp file {filename} should trigger violation"
@@ -94,10 +97,10 @@ class TestFileOrganizationRule:
         """Test detection of test files in root directory."""
         test_files = ["test_something.py", "something_test.py", "test-module.py"]
 
-        for filename in test_files:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for filename in test_files:
                 context = self.create_context(f"/project/{filename}")
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
 
                 assert len(violations) == 1, f"Test file {filename} should trigger violation"
@@ -112,10 +115,10 @@ class TestFileOrganizationRule:
             "/project/test/integration_test/test_api.py",
         ]
 
-        for path in test_paths:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for path in test_paths:
                 context = self.create_context(path)
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 assert len(violations) == 0, f"Test file {path} is properly placed"
 
@@ -130,10 +133,10 @@ class TestFileOrganizationRule:
             "/project/tools/component.tsx",
         ]
 
-        for path in wrong_paths:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for path in wrong_paths:
                 context = self.create_context(path)
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 # TypeScript files won't trigger violations in Python linter context
                 # The rule would need to be extended to handle non-Python files
@@ -146,10 +149,10 @@ class TestFileOrganizationRule:
             "/project/src/app.tsx",
         ]
 
-        for path in correct_paths:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for path in correct_paths:
                 context = self.create_context(path)
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 assert len(violations) == 0, f"TypeScript file {path} is properly placed"
 
@@ -161,10 +164,10 @@ class TestFileOrganizationRule:
         # Files in wrong location
         wrong_paths = ["/project/test.html", "/project/tools/index.html"]
 
-        for path in wrong_paths:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for path in wrong_paths:
                 context = self.create_context(path)
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 # HTML files won't trigger violations in Python linter context
                 # The rule would need to be extended to handle non-Python files
@@ -178,18 +181,18 @@ class TestFileOrganizationRule:
             "/project/.ai/templates/workflow.html",
         ]
 
-        for path in correct_paths:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for path in correct_paths:
                 context = self.create_context(path)
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 assert len(violations) == 0, f"HTML file {path} is properly placed"
 
     def test_python_file_in_root_info_severity(self):
         """Test that regular Python files in root get INFO severity."""
-        with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
             context = self.create_context("/project/some_module.py")
-            module_node = ast.parse("# Test")
+            module_node = _MODULE_NODE
             violations = self.rule.check_node(module_node, context)
 
             assert len(violations) == 1
@@ -210,11 +213,11 @@ class TestFileOrganizationRule:
 
     def test_only_checks_module_node(self):
         """Test that the rule only checks Module nodes to avoid duplicate violations."""
-        with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
             context = self.create_context("/project/debug_test.py")
 
             # Should check Module node
-            module_node = ast.parse("# Test")
+            module_node = _MODULE_NODE
             assert self.rule.should_check_node(module_node, context)
 
             # Should not check other nodes
@@ -226,10 +229,10 @@ class TestFileOrganizationRule:
 
     def test_absolute_and_relative_paths(self):
         """Test that both absolute and relative paths are handled correctly."""
-        with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
             # Test with absolute path
             abs_context = self.create_context("/project/debug_test.py")
-            module_node = ast.parse("# Test")
+            module_node = _MODULE_NODE
             abs_violations = self.rule.check_node(module_node, abs_context)
             assert len(abs_violations) == 1
 
@@ -237,7 +240,7 @@ class TestFileOrganizationRule:
             rel_context = LintContext(
                 file_path=Path("debug_test.py"),
                 file_content="# Test",
-                ast_tree=ast.parse("# Test"),
+                ast_tree=_MODULE_NODE,
                 metadata={},
             )
             rel_violations = self.rule.check_node(module_node, rel_context)
@@ -253,9 +256,9 @@ class TestFileOrganizationRule:
             "/project/src/utils/helper.py",
         ]
 
-        for path in proper_files:
-            with patch("pathlib.Path.cwd", return_value=Path("/project")):
+        with patch.object(Path, "cwd", return_value=_PROJECT_ROOT):
+            for path in proper_files:
                 context = self.create_context(path)
-                module_node = ast.parse("# Test")
+                module_node = _MODULE_NODE
                 violations = self.rule.check_node(module_node, context)
                 assert len(violations) == 0, f"Properly placed file {path} should not trigger violations"
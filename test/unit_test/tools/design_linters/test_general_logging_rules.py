@@ -5,20 +5,18 @@ Scope: Tests all rule classes in general_logging_rules.py
 Overview: This module provides comprehensive tests for NoPlainPrintRule,
     ProperLogLevelsRule, and LoggingInExceptionsRule to ensure proper
     logging best practices enforcement and validate rule behavior.
-Dependencies: unittest, ast, framework modules
-Exports: TestNoPlainPrintRule, TestProperLogLevelsRule, TestLoggingInExceptionsRule
-Interfaces: Standard unittest.TestCase interface for test execution
-Implementation: Comprehensive test coverage using unittest framework with AST parsing
+Dependencies: pytest, ast, framework modules
+Exports: Module-level pytest test functions and shared rule fixtures
+Interfaces: pytest test functions requesting rule and context fixtures
+Implementation: Plain pytest functions with module-scoped rule fixtures and AST parsing
 """
 
 import ast
-import sys
-import unittest
+import functools
 from pathlib import Path
 from typing import Any, Dict
 
-sys.path.insert(0, "/home/stevejackson/Projects/durable-code-test/tools")
-
+import pytest
 from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.logging.general_logging_rules import (
     LoggingInExceptionsRule,
@@ -26,639 +24,620 @@ from design_linters.rules.logging.general_logging_rules import (
     ProperLogLevelsRule,
 )
 
+TRY_EXCEPT_TEMPLATE = "try:\n    risky_operation()\nexcept Exception:\n{body}\n"
 
-class TestNoPlainPrintRule(unittest.TestCase):
-    """Test NoPlainPrintRule functionality."""
+# Production file path, outside the allowed test and script contexts
+_PRODUCTION_PATH = Path("/production.py")
 
-    def setUp(self):
-        self.rule = NoPlainPrintRule()
-        self.context = LintContext(file_path=Path("/production.py"))
 
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.no-print")
-        self.assertEqual(self.rule.rule_name, "No Print Statements")
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"logging", "production", "anti-patterns"})
-        self.assertIn("print statements", self.rule.description.lower())
+# Handler variants differ only in the except body, so each variant is parsed once
+@functools.cache
+def _parse_except_handler(body: str) -> ast.ExceptHandler:
+    """Parse TRY_EXCEPT_TEMPLATE with the given handler body and return the handler node."""
+    tree = ast.parse(TRY_EXCEPT_TEMPLATE.format(body=body))
+    return tree.body[0].handlers[0]
 
-    def test_should_check_node_print_call(self):
-        """Test should_check_node identifies print calls."""
-        # Test print() call
-        code = "print('hello')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
 
-        self.assertTrue(self.rule.should_check_node(print_node, self.context))
+@pytest.fixture(scope="module")
+def no_plain_print_rule():
+    """Shared NoPlainPrintRule instance; the rule keeps no per-check state."""
+    return NoPlainPrintRule()
 
-    def test_should_check_node_non_print_call(self):
-        """Test should_check_node ignores non-print calls."""
-        # Test other function call
-        code = "logger.info('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
 
-        self.assertFalse(self.rule.should_check_node(call_node, self.context))
+@pytest.fixture(scope="module")
+def proper_log_levels_rule():
+    """Shared ProperLogLevelsRule instance; the rule keeps no per-check state."""
+    return ProperLogLevelsRule()
 
-    def test_should_check_node_non_call(self):
-        """Test should_check_node ignores non-call nodes."""
-        code = "x = 5"
-        tree = ast.parse(code)
-        assign_node = tree.body[0]
 
-        self.assertFalse(self.rule.should_check_node(assign_node, self.context))
+@pytest.fixture(scope="module")
+def logging_in_exceptions_rule():
+    """Shared LoggingInExceptionsRule instance; the rule keeps no per-check state."""
+    return LoggingInExceptionsRule()
 
-    def test_check_node_simple_print(self):
-        """Test check_node creates violation for simple print."""
-        code = "print('hello world')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
 
-        violations = self.rule.check_node(print_node, self.context)
+@pytest.fixture
+def context():
+    """Fresh production-file lint context for each test."""
+    return LintContext(file_path=_PRODUCTION_PATH)
 
-        self.assertEqual(len(violations), 1)
-        violation = violations[0]
-        self.assertEqual(violation.rule_id, "logging.no-print")
-        self.assertIn("Print statement found", violation.message)
-        self.assertIn("logger.info", violation.suggestion)
 
-    def test_check_node_error_print_suggestion(self):
-        """Test check_node suggests error level for error messages."""
-        code = "print('Error occurred')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
+# NoPlainPrintRule
 
-        violations = self.rule.check_node(print_node, self.context)
 
-        self.assertEqual(len(violations), 1)
-        self.assertIn("logger.error", violations[0].suggestion)
+def test_should_check_node_print_call(no_plain_print_rule, context):
+    """Test should_check_node identifies print calls."""
+    # Test print() call
+    code = "print('hello')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-    def test_check_node_warning_print_suggestion(self):
-        """Test check_node suggests warning level for warning messages."""
-        code = "print('Warning: deprecated function')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
+    assert no_plain_print_rule.should_check_node(print_node, context)
 
-        violations = self.rule.check_node(print_node, self.context)
 
-        self.assertEqual(len(violations), 1)
-        self.assertIn("logger.warning", violations[0].suggestion)
+def test_should_check_node_non_print_call(no_plain_print_rule, context):
+    """Test should_check_node ignores non-print calls."""
+    # Test other function call
+    code = "logger.info('hello')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-    def test_check_node_debug_print_suggestion(self):
-        """Test check_node suggests debug level for debug messages."""
-        code = "print('Debug: variable dump')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
+    assert not no_plain_print_rule.should_check_node(call_node, context)
 
-        violations = self.rule.check_node(print_node, self.context)
 
-        self.assertEqual(len(violations), 1)
-        self.assertIn("logger.debug", violations[0].suggestion)
+def test_should_check_node_non_call(no_plain_print_rule, context):
+    """Test should_check_node ignores non-call nodes."""
+    code = "x = 5"
+    tree = ast.parse(code)
+    assign_node = tree.body[0]
 
-    def test_check_node_success_print_suggestion(self):
-        """Test check_node suggests success level for success messages."""
-        code = "print('Operation completed successfully')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
+    assert not no_plain_print_rule.should_check_node(assign_node, context)
 
-        violations = self.rule.check_node(print_node, self.context)
 
-        self.assertEqual(len(violations), 1)
-        self.assertIn("logger.success", violations[0].suggestion)
+def test_check_node_simple_print(no_plain_print_rule, context):
+    """Test check_node creates violation for simple print."""
+    code = "print('hello world')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-    def test_check_node_empty_print(self):
-        """Test check_node handles print with no arguments."""
-        code = "print()"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-        violations = self.rule.check_node(print_node, self.context)
+    assert len(violations) == 1
+    violation = violations[0]
+    assert violation.rule_id == "logging.no-print"
+    assert "Print statement found" in violation.message
+    assert "logger.info" in violation.suggestion
 
-        self.assertEqual(len(violations), 1)
-        self.assertIn("logger.info", violations[0].suggestion)
 
-    def test_check_node_non_string_print(self):
-        """Test check_node handles print with non-string arguments."""
-        code = "print(42)"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
+def test_check_node_error_print_suggestion(no_plain_print_rule, context):
+    """Test check_node suggests error level for error messages."""
+    code = "print('Error occurred')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-        violations = self.rule.check_node(print_node, self.context)
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-        self.assertEqual(len(violations), 1)
-        self.assertIn("logger.info", violations[0].suggestion)
+    assert len(violations) == 1
+    assert "logger.error" in violations[0].suggestion
 
-    def test_check_node_wrong_type_raises_error(self):
-        """Test check_node raises TypeError for non-Call nodes."""
-        code = "x = 5"
-        tree = ast.parse(code)
-        assign_node = tree.body[0]
 
-        with self.assertRaises(TypeError):
-            self.rule.check_node(assign_node, self.context)
+def test_check_node_warning_print_suggestion(no_plain_print_rule, context):
+    """Test check_node suggests warning level for warning messages."""
+    code = "print('Warning: deprecated function')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-    def test_get_logging_suggestion_various_keywords(self):
-        """Test _get_logging_suggestion with various keyword patterns."""
-        # Test fail keyword
-        code = "print('Operation failed')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
-        suggestion = self.rule._get_logging_suggestion(print_node)
-        self.assertIn("logger.error", suggestion)
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-        # Test exception keyword
-        code = "print('Exception caught')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
-        suggestion = self.rule._get_logging_suggestion(print_node)
-        self.assertIn("logger.error", suggestion)
+    assert len(violations) == 1
+    assert "logger.warning" in violations[0].suggestion
 
-        # Test warn keyword
-        code = "print('Warn user about issue')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
-        suggestion = self.rule._get_logging_suggestion(print_node)
-        self.assertIn("logger.warning", suggestion)
 
-        # Test trace keyword
-        code = "print('Trace information')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
-        suggestion = self.rule._get_logging_suggestion(print_node)
-        self.assertIn("logger.debug", suggestion)
+def test_check_node_debug_print_suggestion(no_plain_print_rule, context):
+    """Test check_node suggests debug level for debug messages."""
+    code = "print('Debug: variable dump')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-        # Test done keyword
-        code = "print('Task is done')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
-        suggestion = self.rule._get_logging_suggestion(print_node)
-        self.assertIn("logger.success", suggestion)
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-    def test_is_allowed_context_test_file(self):
-        """Test _is_allowed_context allows test files."""
-        test_context = LintContext(file_path=Path("/test_module.py"))
-        config: Dict[str, Any] = {}
+    assert len(violations) == 1
+    assert "logger.debug" in violations[0].suggestion
 
-        result = self.rule._is_allowed_context(test_context, config)
-        self.assertTrue(result)
 
-    def test_is_allowed_context_main_function(self):
-        """Test _is_allowed_context allows main function."""
-        main_context = LintContext(file_path=Path("/script.py"), current_function="__main__")
-        config: Dict[str, Any] = {}
+def test_check_node_success_print_suggestion(no_plain_print_rule, context):
+    """Test check_node suggests success level for success messages."""
+    code = "print('Operation completed successfully')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-        result = self.rule._is_allowed_context(main_context, config)
-        self.assertTrue(result)
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-    def test_allowed_context_skips_violation(self):
-        """Test that allowed contexts skip violation creation."""
-        # Set up a test file context
-        test_context = LintContext(file_path=Path("/test_file.py"))
+    assert len(violations) == 1
+    assert "logger.success" in violations[0].suggestion
 
-        code = "print('hello')"
-        tree = ast.parse(code)
-        print_node = tree.body[0].value
 
-        violations = self.rule.check_node(print_node, test_context)
-        self.assertEqual(len(violations), 0)
+def test_check_node_empty_print(no_plain_print_rule, context):
+    """Test check_node handles print with no arguments."""
+    code = "print()"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-class TestProperLogLevelsRule(unittest.TestCase):
-    """Test ProperLogLevelsRule functionality."""
+    assert len(violations) == 1
+    assert "logger.info" in violations[0].suggestion
 
-    def setUp(self):
-        self.rule = ProperLogLevelsRule()
-        self.context = LintContext(file_path=Path("/production.py"))
 
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.proper-levels")
-        self.assertEqual(self.rule.rule_name, "Proper Log Levels")
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"logging", "best-practices", "levels"})
-        self.assertIn("log levels", self.rule.description.lower())
+def test_check_node_non_string_print(no_plain_print_rule, context):
+    """Test check_node handles print with non-string arguments."""
+    code = "print(42)"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-    def test_should_check_node_logger_call(self):
-        """Test should_check_node identifies logger calls."""
-        code = "logger.info('message')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+    violations = no_plain_print_rule.check_node(print_node, context)
 
-        self.assertTrue(self.rule.should_check_node(call_node, self.context))
+    assert len(violations) == 1
+    assert "logger.info" in violations[0].suggestion
 
-    def test_should_check_node_non_logger_call(self):
-        """Test should_check_node ignores non-logger calls."""
-        code = "print('message')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
 
-        self.assertFalse(self.rule.should_check_node(call_node, self.context))
+def test_check_node_wrong_type_raises_error(no_plain_print_rule, context):
+    """Test check_node raises TypeError for non-Call nodes."""
+    code = "x = 5"
+    tree = ast.parse(code)
+    assign_node = tree.body[0]
 
-    def test_should_check_node_non_call(self):
-        """Test should_check_node ignores non-call nodes."""
-        code = "x = 5"
-        tree = ast.parse(code)
-        assign_node = tree.body[0]
+    with pytest.raises(TypeError):
+        no_plain_print_rule.check_node(assign_node, context)
 
-        self.assertFalse(self.rule.should_check_node(assign_node, self.context))
 
-    def test_is_logging_call_logger_name(self):
-        """Test _is_logging_call identifies various logger names."""
-        test_cases = ["logger.info('test')", "log.error('test')", "logging.debug('test')"]
+def test_get_logging_suggestion_various_keywords(no_plain_print_rule):
+    """Test _get_logging_suggestion with various keyword patterns."""
+    # Test fail keyword
+    code = "print('Operation failed')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
+    suggestion = no_plain_print_rule._get_logging_suggestion(print_node)
+    assert "logger.error" in suggestion
 
-        for code in test_cases:
-            tree = ast.parse(code)
-            call_node = tree.body[0].value
-            self.assertTrue(self.rule._is_logging_call(call_node), f"Failed for: {code}")
+    # Test exception keyword
+    code = "print('Exception caught')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
+    suggestion = no_plain_print_rule._get_logging_suggestion(print_node)
+    assert "logger.error" in suggestion
 
-    def test_is_logging_call_getlogger_pattern(self):
-        """Test _is_logging_call identifies getLogger pattern."""
-        code = "logging.getLogger().info('test')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+    # Test warn keyword
+    code = "print('Warn user about issue')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
+    suggestion = no_plain_print_rule._get_logging_suggestion(print_node)
+    assert "logger.warning" in suggestion
 
-        self.assertTrue(self.rule._is_logging_call(call_node))
+    # Test trace keyword
+    code = "print('Trace information')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
+    suggestion = no_plain_print_rule._get_logging_suggestion(print_node)
+    assert "logger.debug" in suggestion
 
-    def test_is_logging_call_invalid_method(self):
-        """Test _is_logging_call rejects invalid methods."""
-        code = "logger.invalid_method('test')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+    # Test done keyword
+    code = "print('Task is done')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
+    suggestion = no_plain_print_rule._get_logging_suggestion(print_node)
+    assert "logger.success" in suggestion
 
-        self.assertFalse(self.rule._is_logging_call(call_node))
 
-    def test_is_logging_call_non_attribute(self):
-        """Test _is_logging_call rejects non-attribute calls."""
-        code = "some_function('test')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+def test_is_allowed_context_test_file(no_plain_print_rule):
+    """Test _is_allowed_context allows test files."""
+    test_context = LintContext(file_path=Path("/test_module.py"))
+    config: Dict[str, Any] = {}
 
-        self.assertFalse(self.rule._is_logging_call(call_node))
+    result = no_plain_print_rule._is_allowed_context(test_context, config)
+    assert result
 
-    def test_check_node_error_in_loop(self):
-        """Test check_node detects error logging in loops."""
-        code = """
-for i in range(10):
-    logger.error('Error in loop')
-"""
-        tree = ast.parse(code)
-        for_node = tree.body[0]
-        call_node = for_node.body[0].value
 
-        # Set up context with loop in stack
-        loop_context = LintContext(file_path=Path("/production.py"), node_stack=[for_node])
+def test_is_allowed_context_main_function(no_plain_print_rule):
+    """Test _is_allowed_context allows main function."""
+    main_context = LintContext(file_path=Path("/script.py"), current_function="__main__")
+    config: Dict[str, Any] = {}
 
-        violations = self.rule.check_node(call_node, loop_context)
+    result = no_plain_print_rule._is_allowed_context(main_context, config)
+    assert result
 
-        self.assertEqual(len(violations), 1)
-        violation = violations[0]
-        self.assertIn("Error logging inside loop", violation.message)
-        self.assertIn("rate limiting", violation.suggestion)
 
-    def test_check_node_debug_for_important_info(self):
-        """Test check_node detects debug level for important information."""
-        code = "logger.debug('Service started successfully')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+def test_allowed_context_skips_violation(no_plain_print_rule):
+    """Test that allowed contexts skip violation creation."""
+    # Set up a test file context
+    test_context = LintContext(file_path=Path("/test_file.py"))
 
-        violations = self.rule.check_node(call_node, self.context)
+    code = "print('hello')"
+    tree = ast.parse(code)
+    print_node = tree.body[0].value
 
-        self.assertEqual(len(violations), 1)
-        violation = violations[0]
-        self.assertIn("Debug level used for potentially important", violation.message)
-        self.assertIn("logger.info", violation.suggestion)
+    violations = no_plain_print_rule.check_node(print_node, test_context)
+    assert len(violations) == 0
 
-    def test_check_node_normal_debug_no_violation(self):
-        """Test check_node doesn't flag normal debug messages."""
-        code = "logger.debug('Internal variable state')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
 
-        violations = self.rule.check_node(call_node, self.context)
+# ProperLogLevelsRule
 
-        self.assertEqual(len(violations), 0)
 
-    def test_check_node_non_call_raises_error(self):
-        """Test check_node raises TypeError for non-Call nodes."""
-        code = "x = 5"
-        tree = ast.parse(code)
-        assign_node = tree.body[0]
+def test_should_check_node_logger_call(proper_log_levels_rule, context):
+    """Test should_check_node identifies logger calls."""
+    code = "logger.info('message')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
+
+    assert proper_log_levels_rule.should_check_node(call_node, context)
+
+
+def test_should_check_node_non_logger_call(proper_log_levels_rule, context):
+    """Test should_check_node ignores non-logger calls."""
+    code = "print('message')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
+
+    assert not proper_log_levels_rule.should_check_node(call_node, context)
+
+
+def test_proper_levels_should_check_node_non_call(proper_log_levels_rule, context):
+    """Test should_check_node ignores non-call nodes."""
+    code = "x = 5"
+    tree = ast.parse(code)
+    assign_node = tree.body[0]
+
+    assert not proper_log_levels_rule.should_check_node(assign_node, context)
 
-        with self.assertRaises(TypeError):
-            self.rule.check_node(assign_node, self.context)
 
-    def test_check_node_non_logging_call(self):
-        """Test check_node returns empty for non-logging calls."""
-        code = "print('test')"
+def test_is_logging_call_logger_name(proper_log_levels_rule):
+    """Test _is_logging_call identifies various logger names."""
+    test_cases = ["logger.info('test')", "log.error('test')", "logging.debug('test')"]
+
+    for code in test_cases:
         tree = ast.parse(code)
         call_node = tree.body[0].value
+        assert proper_log_levels_rule._is_logging_call(call_node), f"Failed for: {code}"
 
-        violations = self.rule.check_node(call_node, self.context)
 
-        self.assertEqual(len(violations), 0)
+def test_is_logging_call_getlogger_pattern(proper_log_levels_rule):
+    """Test _is_logging_call identifies getLogger pattern."""
+    code = "logging.getLogger().info('test')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-    def test_is_in_loop_for_loop(self):
-        """Test _is_in_loop detects for loops."""
-        code = """
-for i in range(10):
-    pass
-"""
-        tree = ast.parse(code)
-        for_node = tree.body[0]
+    assert proper_log_levels_rule._is_logging_call(call_node)
 
-        loop_context = LintContext(file_path=Path("/test.py"), node_stack=[for_node])
 
-        self.assertTrue(self.rule._is_in_loop(loop_context))
+def test_proper_levels_is_logging_call_invalid_method(proper_log_levels_rule):
+    """Test _is_logging_call rejects invalid methods."""
+    code = "logger.invalid_method('test')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-    def test_is_in_loop_while_loop(self):
-        """Test _is_in_loop detects while loops."""
-        code = """
-while True:
-    pass
-"""
-        tree = ast.parse(code)
-        while_node = tree.body[0]
+    assert not proper_log_levels_rule._is_logging_call(call_node)
 
-        loop_context = LintContext(file_path=Path("/production.py"), node_stack=[while_node])
 
-        self.assertTrue(self.rule._is_in_loop(loop_context))
+def test_proper_levels_is_logging_call_non_attribute(proper_log_levels_rule):
+    """Test _is_logging_call rejects non-attribute calls."""
+    code = "some_function('test')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-    def test_is_in_loop_no_loop(self):
-        """Test _is_in_loop returns False when not in loop."""
-        context = LintContext(file_path=Path("/production.py"))
-        self.assertFalse(self.rule._is_in_loop(context))
+    assert not proper_log_levels_rule._is_logging_call(call_node)
 
-    def test_is_in_loop_function_boundary(self):
-        """Test _is_in_loop stops at function boundaries."""
-        code = """
-def func():
-    for i in range(10):
-        pass
-"""
-        tree = ast.parse(code)
-        func_node = tree.body[0]
-        for_node = func_node.body[0]
-
-        # Context inside function but outside loop scope
-        context = LintContext(file_path=Path("/production.py"), node_stack=[func_node])  # Only function in stack
-
-        self.assertFalse(self.rule._is_in_loop(context))
-
-    def test_appears_production_critical_keywords(self):
-        """Test _appears_production_critical detects important keywords."""
-        important_keywords = [
-            "started",
-            "starting",
-            "initialized",
-            "connected",
-            "loaded",
-            "finished",
-            "completed",
-            "processed",
-            "received",
-            "sent",
-        ]
-
-        for keyword in important_keywords:
-            code = f"logger.debug('Service {keyword}')"
-            tree = ast.parse(code)
-            call_node = tree.body[0].value
-
-            result = self.rule._appears_production_critical(call_node, self.context)
-            self.assertTrue(result, f"Failed for keyword: {keyword}")
-
-    def test_appears_production_critical_normal_debug(self):
-        """Test _appears_production_critical doesn't flag normal debug."""
-        code = "logger.debug('Variable x = 42')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
 
-        result = self.rule._appears_production_critical(call_node, self.context)
-        self.assertFalse(result)
+def test_check_node_error_in_loop(proper_log_levels_rule):
+    """Test check_node detects error logging in loops."""
+    code = "for i in range(10):\n    logger.error('Error in loop')"
+    tree = ast.parse(code)
+    for_node = tree.body[0]
+    call_node = for_node.body[0].value
 
-    def test_appears_production_critical_no_args(self):
-        """Test _appears_production_critical handles no arguments."""
-        code = "logger.debug()"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+    # Set up context with loop in stack
+    loop_context = LintContext(file_path=_PRODUCTION_PATH, node_stack=[for_node])
 
-        result = self.rule._appears_production_critical(call_node, self.context)
-        self.assertFalse(result)
+    violations = proper_log_levels_rule.check_node(call_node, loop_context)
 
-    def test_appears_production_critical_non_string(self):
-        """Test _appears_production_critical handles non-string arguments."""
-        code = "logger.debug(42)"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+    assert len(violations) == 1
+    violation = violations[0]
+    assert "Error logging inside loop" in violation.message
+    assert "rate limiting" in violation.suggestion
 
-        result = self.rule._appears_production_critical(call_node, self.context)
-        self.assertFalse(result)
 
+def test_check_node_debug_for_important_info(proper_log_levels_rule, context):
+    """Test check_node detects debug level for important information."""
+    code = "logger.debug('Service started successfully')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-class TestLoggingInExceptionsRule(unittest.TestCase):
-    """Test LoggingInExceptionsRule functionality."""
+    violations = proper_log_levels_rule.check_node(call_node, context)
 
-    def setUp(self):
-        self.rule = LoggingInExceptionsRule()
-        self.context = LintContext(file_path=Path("/production.py"))
+    assert len(violations) == 1
+    violation = violations[0]
+    assert "Debug level used for potentially important" in violation.message
+    assert "logger.info" in violation.suggestion
 
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.exception-logging")
-        self.assertEqual(self.rule.rule_name, "Exception Logging")
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"logging", "exceptions", "debugging"})
-        self.assertIn("exception handlers", self.rule.description.lower())
 
-    def test_should_check_node_except_handler(self):
-        """Test should_check_node identifies exception handlers."""
-        code = """
-try:
-    pass
-except Exception:
-    pass
-"""
-        tree = ast.parse(code)
-        try_node = tree.body[0]
-        except_node = try_node.handlers[0]
+def test_check_node_normal_debug_no_violation(proper_log_levels_rule, context):
+    """Test check_node doesn't flag normal debug messages."""
+    code = "logger.debug('Internal variable state')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-        self.assertTrue(self.rule.should_check_node(except_node, self.context))
+    violations = proper_log_levels_rule.check_node(call_node, context)
 
-    def test_should_check_node_non_except_handler(self):
-        """Test should_check_node ignores non-exception handlers."""
-        code = "x = 5"
-        tree = ast.parse(code)
-        assign_node = tree.body[0]
+    assert len(violations) == 0
 
-        self.assertFalse(self.rule.should_check_node(assign_node, self.context))
 
-    def test_check_node_no_logging_no_reraise(self):
-        """Test check_node flags exception handler with no logging or re-raise."""
-        code = """
-try:
-    risky_operation()
-except Exception:
-    x = 1  # No logging or re-raise
-"""
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+def test_check_node_non_call_raises_error(proper_log_levels_rule, context):
+    """Test check_node raises TypeError for non-Call nodes."""
+    code = "x = 5"
+    tree = ast.parse(code)
+    assign_node = tree.body[0]
 
-        violations = self.rule.check_node(except_node, self.context)
+    with pytest.raises(TypeError):
+        proper_log_levels_rule.check_node(assign_node, context)
 
-        self.assertEqual(len(violations), 1)
-        violation = violations[0]
-        self.assertIn("Exception handler without logging", violation.message)
-        self.assertIn("logger.exception", violation.suggestion)
 
-    def test_check_node_with_logging_no_violation(self):
-        """Test check_node doesn't flag exception handler with proper logging."""
-        code = """
-try:
-    risky_operation()
-except Exception:
-    logger.error('Operation failed')
-"""
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+def test_check_node_non_logging_call(proper_log_levels_rule, context):
+    """Test check_node returns empty for non-logging calls."""
+    code = "print('test')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-        violations = self.rule.check_node(except_node, self.context)
+    violations = proper_log_levels_rule.check_node(call_node, context)
 
-        self.assertEqual(len(violations), 0)
+    assert len(violations) == 0
 
-    def test_check_node_with_reraise_no_violation(self):
-        """Test check_node doesn't flag exception handler with re-raise."""
-        code = """
-try:
-    risky_operation()
-except Exception:
-    cleanup()
-    raise
-"""
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
 
-        violations = self.rule.check_node(except_node, self.context)
+def test_is_in_loop_for_loop(proper_log_levels_rule):
+    """Test _is_in_loop detects for loops."""
+    code = "for i in range(10):\n    pass"
+    tree = ast.parse(code)
+    for_node = tree.body[0]
 
-        self.assertEqual(len(violations), 0)
+    loop_context = LintContext(file_path=Path("/test.py"), node_stack=[for_node])
 
-    def test_check_node_wrong_log_level(self):
-        """Test check_node flags inappropriate log levels in exception handlers."""
-        code = """
-try:
-    risky_operation()
-except Exception:
-    logger.info('Something went wrong')
-"""
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    assert proper_log_levels_rule._is_in_loop(loop_context)
 
-        violations = self.rule.check_node(except_node, self.context)
 
-        self.assertEqual(len(violations), 1)
-        violation = violations[0]
-        self.assertIn("Using info level for exception", violation.message)
-        self.assertEqual(violation.severity, Severity.INFO)
+def test_is_in_loop_while_loop(proper_log_levels_rule):
+    """Test _is_in_loop detects while loops."""
+    code = "while True:\n    pass"
+    tree = ast.parse(code)
+    while_node = tree.body[0]
 
-    def test_check_node_proper_exception_logging(self):
-        """Test check_node accepts proper exception logging methods."""
-        proper_methods = ["error", "exception", "critical"]
+    loop_context = LintContext(file_path=_PRODUCTION_PATH, node_stack=[while_node])
 
-        for method in proper_methods:
-            code = f"""
-try:
-    risky_operation()
-except Exception:
-    logger.{method}('Operation failed')
-"""
-            tree = ast.parse(code)
-            except_node = tree.body[0].handlers[0]
+    assert proper_log_levels_rule._is_in_loop(loop_context)
 
-            violations = self.rule.check_node(except_node, self.context)
-            self.assertEqual(len(violations), 0, f"Failed for method: {method}")
 
-    def test_check_node_wrong_type_raises_error(self):
-        """Test check_node raises TypeError for non-ExceptHandler nodes."""
-        code = "x = 5"
+def test_is_in_loop_no_loop(proper_log_levels_rule):
+    """Test _is_in_loop returns False when not in loop."""
+    context = LintContext(file_path=_PRODUCTION_PATH)
+    assert not proper_log_levels_rule._is_in_loop(context)
+
+
+def test_is_in_loop_function_boundary(proper_log_levels_rule):
+    """Test _is_in_loop stops at function boundaries."""
+    code = "def func():\n    for i in range(10):\n        pass"
+    tree = ast.parse(code)
+    func_node = tree.body[0]
+    for_node = func_node.body[0]
+
+    # Context inside function but outside loop scope
+    context = LintContext(file_path=_PRODUCTION_PATH, node_stack=[func_node])  # Only function in stack
+
+    assert not proper_log_levels_rule._is_in_loop(context)
+
+
+def test_appears_production_critical_keywords(proper_log_levels_rule, context):
+    """Test _appears_production_critical detects important keywords."""
+    important_keywords = [
+        "started",
+        "starting",
+        "initialized",
+        "connected",
+        "loaded",
+        "finished",
+        "completed",
+        "processed",
+        "received",
+        "sent",
+    ]
+
+    for keyword in important_keywords:
+        code = f"logger.debug('Service {keyword}')"
         tree = ast.parse(code)
-        assign_node = tree.body[0]
+        call_node = tree.body[0].value
+
+        result = proper_log_levels_rule._appears_production_critical(call_node, context)
+        assert result, f"Failed for keyword: {keyword}"
+
+
+def test_appears_production_critical_normal_debug(proper_log_levels_rule, context):
+    """Test _appears_production_critical doesn't flag normal debug."""
+    code = "logger.debug('Variable x = 42')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
+
+    result = proper_log_levels_rule._appears_production_critical(call_node, context)
+    assert not result
+
+
+def test_appears_production_critical_no_args(proper_log_levels_rule, context):
+    """Test _appears_production_critical handles no arguments."""
+    code = "logger.debug()"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
+
+    result = proper_log_levels_rule._appears_production_critical(call_node, context)
+    assert not result
+
+
+def test_appears_production_critical_non_string(proper_log_levels_rule, context):
+    """Test _appears_production_critical handles non-string arguments."""
+    code = "logger.debug(42)"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-        with self.assertRaises(TypeError):
-            self.rule.check_node(assign_node, self.context)
+    result = proper_log_levels_rule._appears_production_critical(call_node, context)
+    assert not result
 
-    def test_has_logging_in_handler_true(self):
-        """Test _has_logging_in_handler detects logging calls."""
-        code = """
+
+# LoggingInExceptionsRule
+
+
+def test_should_check_node_except_handler(logging_in_exceptions_rule, context):
+    """Test should_check_node identifies exception handlers."""
+    code = """
+try:
+    pass
+except Exception:
+    pass
+"""
+    tree = ast.parse(code)
+    try_node = tree.body[0]
+    except_node = try_node.handlers[0]
+
+    assert logging_in_exceptions_rule.should_check_node(except_node, context)
+
+
+def test_should_check_node_non_except_handler(logging_in_exceptions_rule, context):
+    """Test should_check_node ignores non-exception handlers."""
+    code = "x = 5"
+    tree = ast.parse(code)
+    assign_node = tree.body[0]
+
+    assert not logging_in_exceptions_rule.should_check_node(assign_node, context)
+
+
+@pytest.mark.parametrize(
+    "handler_body,expected_message,expected_suggestion,expected_severity",
+    [
+        (
+            "    x = 1  # No logging or re-raise",
+            "Exception handler without logging",
+            "logger.exception",
+            Severity.WARNING,
+        ),
+        ("    logger.error('Operation failed')", None, None, None),
+        ("    cleanup()\n    raise", None, None, None),
+        ("    logger.info('Something went wrong')", "Using info level for exception", None, Severity.INFO),
+        ("    logger.exception('Operation failed')", None, None, None),
+        ("    logger.critical('Operation failed')", None, None, None),
+    ],
+    ids=["no-logging-no-reraise", "error-level", "reraise", "info-level", "exception-level", "critical-level"],
+)
+def test_check_node_exception_handler_variants(
+    logging_in_exceptions_rule, context, handler_body, expected_message, expected_suggestion, expected_severity
+):
+    """Test check_node on variants of the same try/except handler."""
+    except_node = _parse_except_handler(handler_body)
+
+    violations = logging_in_exceptions_rule.check_node(except_node, context)
+
+    if expected_message is None:
+        assert len(violations) == 0
+        return
+    assert len(violations) == 1
+    violation = violations[0]
+    assert expected_message in violation.message
+    assert violation.severity == expected_severity
+    if expected_suggestion:
+        assert expected_suggestion in violation.suggestion
+
+
+def test_exception_logging_check_node_wrong_type_raises_error(logging_in_exceptions_rule, context):
+    """Test check_node raises TypeError for non-ExceptHandler nodes."""
+    code = "x = 5"
+    tree = ast.parse(code)
+    assign_node = tree.body[0]
+
+    with pytest.raises(TypeError):
+        logging_in_exceptions_rule.check_node(assign_node, context)
+
+
+def test_has_logging_in_handler_true(logging_in_exceptions_rule):
+    """Test _has_logging_in_handler detects logging calls."""
+    code = """
 try:
     pass
 except Exception:
     logger.error('Error occurred')
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
+
+    result = logging_in_exceptions_rule._has_logging_in_handler(except_node)
+    assert result
 
-        result = self.rule._has_logging_in_handler(except_node)
-        self.assertTrue(result)
 
-    def test_has_logging_in_handler_false(self):
-        """Test _has_logging_in_handler returns False when no logging."""
-        code = """
+def test_has_logging_in_handler_false(logging_in_exceptions_rule):
+    """Test _has_logging_in_handler returns False when no logging."""
+    code = """
 try:
     pass
 except Exception:
     x = 1
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
+
+    result = logging_in_exceptions_rule._has_logging_in_handler(except_node)
+    assert not result
 
-        result = self.rule._has_logging_in_handler(except_node)
-        self.assertFalse(result)
 
-    def test_has_reraise_true(self):
-        """Test _has_reraise detects bare raise statements."""
-        code = """
+def test_has_reraise_true(logging_in_exceptions_rule):
+    """Test _has_reraise detects bare raise statements."""
+    code = """
 try:
     pass
 except Exception:
     cleanup()
     raise
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
+
+    result = logging_in_exceptions_rule._has_reraise(except_node)
+    assert result
 
-        result = self.rule._has_reraise(except_node)
-        self.assertTrue(result)
 
-    def test_has_reraise_false_no_raise(self):
-        """Test _has_reraise returns False when no raise."""
-        code = """
+def test_has_reraise_false_no_raise(logging_in_exceptions_rule):
+    """Test _has_reraise returns False when no raise."""
+    code = """
 try:
     pass
 except Exception:
     x = 1
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
+
+    result = logging_in_exceptions_rule._has_reraise(except_node)
+    assert not result
 
-        result = self.rule._has_reraise(except_node)
-        self.assertFalse(result)
 
-    def test_has_reraise_false_raise_with_exception(self):
-        """Test _has_reraise returns False for raise with specific exception."""
-        code = """
+def test_has_reraise_false_raise_with_exception(logging_in_exceptions_rule):
+    """Test _has_reraise returns False for raise with specific exception."""
+    code = """
 try:
     pass
 except Exception:
     raise ValueError('New error')
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
+
+    result = logging_in_exceptions_rule._has_reraise(except_node)
+    assert not result
 
-        result = self.rule._has_reraise(except_node)
-        self.assertFalse(result)
 
-    def test_get_logging_calls_in_handler(self):
-        """Test _get_logging_calls_in_handler finds all logging calls."""
-        code = """
+def test_get_logging_calls_in_handler(logging_in_exceptions_rule):
+    """Test _get_logging_calls_in_handler finds all logging calls."""
+    code = """
 try:
     pass
 except Exception:
@@ -666,63 +645,69 @@ except Exception:
     cleanup()
     logger.warning('Second warning')
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
 
-        calls = self.rule._get_logging_calls_in_handler(except_node)
-        self.assertEqual(len(calls), 2)
+    calls = logging_in_exceptions_rule._get_logging_calls_in_handler(except_node)
+    assert len(calls) == 2
 
-    def test_get_logging_calls_in_handler_empty(self):
-        """Test _get_logging_calls_in_handler returns empty when no logging."""
-        code = """
+
+def test_get_logging_calls_in_handler_empty(logging_in_exceptions_rule):
+    """Test _get_logging_calls_in_handler returns empty when no logging."""
+    code = """
 try:
     pass
 except Exception:
     x = 1
     y = 2
 """
-        tree = ast.parse(code)
-        except_node = tree.body[0].handlers[0]
+    tree = ast.parse(code)
+    except_node = tree.body[0].handlers[0]
 
-        calls = self.rule._get_logging_calls_in_handler(except_node)
-        self.assertEqual(len(calls), 0)
+    calls = logging_in_exceptions_rule._get_logging_calls_in_handler(except_node)
+    assert len(calls) == 0
 
-    def test_is_logging_call_various_loggers(self):
-        """Test _is_logging_call with various logger names."""
-        test_cases = ["logger.error('test')", "log.exception('test')", "logging.critical('test')"]
 
-        for code in test_cases:
-            tree = ast.parse(code)
-            call_node = tree.body[0].value
-            self.assertTrue(self.rule._is_logging_call(call_node), f"Failed for: {code}")
+def test_is_logging_call_various_loggers(logging_in_exceptions_rule):
+    """Test _is_logging_call with various logger names."""
+    test_cases = ["logger.error('test')", "log.exception('test')", "logging.critical('test')"]
 
-    def test_is_logging_call_includes_exception_method(self):
-        """Test _is_logging_call includes exception method."""
-        code = "logger.exception('Error with traceback')"
+    for code in test_cases:
         tree = ast.parse(code)
         call_node = tree.body[0].value
+        assert logging_in_exceptions_rule._is_logging_call(call_node), f"Failed for: {code}"
 
-        self.assertTrue(self.rule._is_logging_call(call_node))
 
-    def test_is_logging_call_invalid_method(self):
-        """Test _is_logging_call rejects invalid methods."""
-        code = "logger.invalid('test')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+def test_is_logging_call_includes_exception_method(logging_in_exceptions_rule):
+    """Test _is_logging_call includes exception method."""
+    code = "logger.exception('Error with traceback')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-        self.assertFalse(self.rule._is_logging_call(call_node))
+    assert logging_in_exceptions_rule._is_logging_call(call_node)
 
-    def test_is_logging_call_non_attribute(self):
-        """Test _is_logging_call rejects non-attribute calls."""
-        code = "some_function('test')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
 
-        self.assertFalse(self.rule._is_logging_call(call_node))
+def test_exception_logging_is_logging_call_invalid_method(logging_in_exceptions_rule):
+    """Test _is_logging_call rejects invalid methods."""
+    code = "logger.invalid('test')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
 
-    def test_nested_exception_handler(self):
-        """Test complex nested exception handling."""
-        code = """
+    assert not logging_in_exceptions_rule._is_logging_call(call_node)
+
+
+def test_exception_logging_is_logging_call_non_attribute(logging_in_exceptions_rule):
+    """Test _is_logging_call rejects non-attribute calls."""
+    code = "some_function('test')"
+    tree = ast.parse(code)
+    call_node = tree.body[0].value
+
+    assert not logging_in_exceptions_rule._is_logging_call(call_node)
+
+
+def test_nested_exception_handler(logging_in_exceptions_rule, context):
+    """Test complex nested exception handling."""
+    code = """
 try:
     try:
         risky_operation()
@@ -732,15 +717,11 @@ try:
 except Exception:
     pass  # No logging here
 """
-        tree = ast.parse(code)
-        outer_except = tree.body[0].handlers[0]
-
-        violations = self.rule.check_node(outer_except, self.context)
-
-        # Should flag the outer exception handler for missing logging
-        self.assertEqual(len(violations), 1)
-        self.assertIn("Exception handler without logging", violations[0].message)
+    tree = ast.parse(code)
+    outer_except = tree.body[0].handlers[0]
 
+    violations = logging_in_exceptions_rule.check_node(outer_except, context)
 
-if __name__ == "__main__":
-    unittest.main()
+    # Should flag the outer exception handler for missing logging
+    assert len(violations) == 1
+    assert "Exception handler without logging" in violations[0].message
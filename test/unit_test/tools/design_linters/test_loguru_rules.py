@@ -16,11 +16,8 @@ import ast
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
 
-sys.path.insert(0, "/home/stevejackson/Projects/durable-code-test/tools")
-
-from design_linters.framework.interfaces import LintContext, LintViolation, Severity
+from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.logging.loguru_rules import (
     LogLevelConsistencyRule,
     LoguruConfigurationRule,
@@ -29,6 +26,18 @@ from design_linters.rules.logging.loguru_rules import (
     UseLoguruRule,
 )
 
+# Snippets reused across many tests are parsed once at import time; rules never mutate them
+_IMPORT_LOGGING_NODE = ast.parse("import logging").body[0]
+_FROM_LOGGING_IMPORT_NODE = ast.parse("from logging import getLogger").body[0]
+_IMPORT_LOGURU_NODE = ast.parse("import loguru").body[0]
+_FROM_LOGURU_IMPORT_NODE = ast.parse("from loguru import logger").body[0]
+_FROM_COLLECTIONS_IMPORT_NODE = ast.parse("from collections import defaultdict").body[0]
+_ASSIGN_NODE = ast.parse("x = 1").body[0]
+_LOGGER_INFO_CALL_NODE = ast.parse("logger.info('test')", mode="eval").body
+_PRINT_CALL_NODE = ast.parse("print('test')", mode="eval").body
+
+_TEST_PATH = Path("/test.py")
+
 
 class TestUseLoguruRule(unittest.TestCase):
     """Test UseLoguruRule implementation."""
@@ -36,21 +45,13 @@ class TestUseLoguruRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = UseLoguruRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.use-loguru")
-        self.assertEqual(self.rule.rule_name, "Use Loguru for Logging")
-        self.assertIn("loguru over standard logging", self.rule.description)
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"logging", "loguru", "best-practices"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_import(self):
         """Test should_check_node for import statements."""
-        import_node = ast.parse("import logging").body[0]
-        from_import_node = ast.parse("from logging import getLogger").body[0]
-        assign_node = ast.parse("x = 1").body[0]
+        import_node = _IMPORT_LOGGING_NODE
+        from_import_node = _FROM_LOGGING_IMPORT_NODE
+        assign_node = _ASSIGN_NODE
 
         self.assertTrue(self.rule.should_check_node(import_node, self.context))
         self.assertTrue(self.rule.should_check_node(from_import_node, self.context))
@@ -58,7 +59,7 @@ class TestUseLoguruRule(unittest.TestCase):
 
     def test_check_node_import_logging(self):
         """Test detection of standard logging import."""
-        node = ast.parse("import logging").body[0]
+        node = _IMPORT_LOGGING_NODE
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -78,7 +79,7 @@ class TestUseLoguruRule(unittest.TestCase):
 
     def test_check_node_from_import_logging(self):
         """Test detection of from logging import."""
-        node = ast.parse("from logging import getLogger").body[0]
+        node = _FROM_LOGGING_IMPORT_NODE
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -92,19 +93,19 @@ class TestUseLoguruRule(unittest.TestCase):
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
-        node = ast.parse("from collections import defaultdict").body[0]
+        node = _FROM_COLLECTIONS_IMPORT_NODE
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_check_node_loguru_import(self):
         """Test that loguru imports are not flagged."""
-        node = ast.parse("from loguru import logger").body[0]
+        node = _FROM_LOGURU_IMPORT_NODE
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_create_violation(self):
         """Test _create_violation method."""
-        node = ast.parse("import logging").body[0]
+        node = _IMPORT_LOGGING_NODE
         violation = self.rule._create_violation(node, self.context, "logging")
 
         self.assertEqual(violation.rule_id, "logging.use-loguru")
@@ -120,21 +121,13 @@ class TestLoguruImportRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = LoguruImportRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.loguru-import")
-        self.assertEqual(self.rule.rule_name, "Proper Loguru Import")
-        self.assertIn("recommended pattern", self.rule.description)
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"logging", "loguru", "imports"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node(self):
         """Test should_check_node for import statements."""
-        import_node = ast.parse("import loguru").body[0]
-        from_import_node = ast.parse("from loguru import logger").body[0]
-        assign_node = ast.parse("x = 1").body[0]
+        import_node = _IMPORT_LOGURU_NODE
+        from_import_node = _FROM_LOGURU_IMPORT_NODE
+        assign_node = _ASSIGN_NODE
 
         self.assertTrue(self.rule.should_check_node(import_node, self.context))
         self.assertTrue(self.rule.should_check_node(from_import_node, self.context))
@@ -142,7 +135,7 @@ class TestLoguruImportRule(unittest.TestCase):
 
     def test_check_node_correct_loguru_import(self):
         """Test that correct loguru import is not flagged."""
-        node = ast.parse("from loguru import logger").body[0]
+        node = _FROM_LOGURU_IMPORT_NODE
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
@@ -168,7 +161,7 @@ class TestLoguruImportRule(unittest.TestCase):
 
     def test_check_node_full_module_import(self):
         """Test detection of full module import."""
-        node = ast.parse("import loguru").body[0]
+        node = _IMPORT_LOGURU_NODE
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -186,11 +179,11 @@ class TestLoguruImportRule(unittest.TestCase):
 
     def test_check_node_non_loguru_import(self):
         """Test that non-loguru imports are ignored."""
-        node = ast.parse("import logging").body[0]
+        node = _IMPORT_LOGGING_NODE
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
-        node = ast.parse("from collections import defaultdict").body[0]
+        node = _FROM_COLLECTIONS_IMPORT_NODE
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
@@ -201,21 +194,13 @@ class TestStructuredLoggingRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = StructuredLoggingRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.structured-logging")
-        self.assertEqual(self.rule.rule_name, "Structured Logging")
-        self.assertIn("structured logging", self.rule.description)
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"logging", "loguru", "observability"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node(self):
         """Test should_check_node for logger calls."""
-        logger_call = ast.parse("logger.info('test')").body[0].value
-        other_call = ast.parse("print('test')").body[0].value
-        assignment = ast.parse("x = 1").body[0]
+        logger_call = _LOGGER_INFO_CALL_NODE
+        other_call = _PRINT_CALL_NODE
+        assignment = _ASSIGN_NODE
 
         self.assertTrue(self.rule.should_check_node(logger_call, self.context))
         self.assertFalse(self.rule.should_check_node(other_call, self.context))
@@ -223,20 +208,20 @@ class TestStructuredLoggingRule(unittest.TestCase):
 
     def test_check_node_non_call_raises_error(self):
         """Test that non-Call nodes raise TypeError."""
-        node = ast.parse("x = 1").body[0]
+        node = _ASSIGN_NODE
         with self.assertRaises(TypeError):
             self.rule.check_node(node, self.context)
 
     def test_check_node_non_logger_call(self):
         """Test that non-logger calls return empty violations."""
-        node = ast.parse("print('test')").body[0].value
+        node = _PRINT_CALL_NODE
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_check_node_f_string_logging(self):
         """Test detection of f-string in logging."""
         code = "logger.info(f'User {user_id} logged in')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -249,7 +234,7 @@ class TestStructuredLoggingRule(unittest.TestCase):
     def test_check_node_format_method_logging(self):
         """Test detection of .format() method in logging."""
         code = "logger.error('Error in {}'.format(module))"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -258,7 +243,7 @@ class TestStructuredLoggingRule(unittest.TestCase):
     def test_check_node_percent_formatting(self):
         """Test detection of % formatting in logging."""
         code = "logger.warning('Value is %s' % value)"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -267,7 +252,7 @@ class TestStructuredLoggingRule(unittest.TestCase):
     def test_check_node_complex_message_without_context(self):
         """Test detection of complex messages without context variables."""
         code = "logger.info('Operation completed successfully with all validation checks passed')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -278,7 +263,7 @@ class TestStructuredLoggingRule(unittest.TestCase):
     def test_check_node_simple_message_no_violation(self):
         """Test that simple messages don't trigger violations."""
         code = "logger.info('OK')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 0)
@@ -286,7 +271,7 @@ class TestStructuredLoggingRule(unittest.TestCase):
     def test_check_node_structured_logging_no_violation(self):
         """Test that proper structured logging doesn't trigger violations."""
         code = "logger.info('User logged in', user_id=user_id, ip=ip)"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 0)
@@ -304,14 +289,14 @@ class TestStructuredLoggingRule(unittest.TestCase):
 
         for code in valid_calls:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertTrue(self.rule._is_logger_call(node))
 
         invalid_calls = ["logger.add('test')", "other.info('test')", "print('test')"]
 
         for code in invalid_calls:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertFalse(self.rule._is_logger_call(node))
 
     def test_uses_string_formatting(self):
@@ -324,14 +309,14 @@ class TestStructuredLoggingRule(unittest.TestCase):
 
         for code in formatting_cases:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertTrue(self.rule._uses_string_formatting(node))
 
         non_formatting_cases = ["logger.info('test')", "logger.info('test', var=var)"]
 
         for code in non_formatting_cases:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertFalse(self.rule._uses_string_formatting(node))
 
     def test_has_complex_message(self):
@@ -345,7 +330,7 @@ class TestStructuredLoggingRule(unittest.TestCase):
 
         for code in complex_cases:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertTrue(self.rule._has_complex_message(node))
 
         simple_cases = [
@@ -356,13 +341,13 @@ class TestStructuredLoggingRule(unittest.TestCase):
 
         for code in simple_cases:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertFalse(self.rule._has_complex_message(node))
 
     def test_check_node_no_args(self):
         """Test handling of logger calls with no arguments."""
         code = "logger.info()"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         # Should not crash and return no violations
@@ -375,34 +360,26 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = LogLevelConsistencyRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.log-level-consistency")
-        self.assertEqual(self.rule.rule_name, "Log Level Consistency")
-        self.assertIn("appropriate log levels", self.rule.description)
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"logging", "loguru", "consistency"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node(self):
         """Test should_check_node for logger calls."""
-        logger_call = ast.parse("logger.info('test')").body[0].value
-        other_call = ast.parse("print('test')").body[0].value
+        logger_call = _LOGGER_INFO_CALL_NODE
+        other_call = _PRINT_CALL_NODE
 
         self.assertTrue(self.rule.should_check_node(logger_call, self.context))
         self.assertFalse(self.rule.should_check_node(other_call, self.context))
 
     def test_check_node_non_call_raises_error(self):
         """Test that non-Call nodes raise TypeError."""
-        node = ast.parse("x = 1").body[0]
+        node = _ASSIGN_NODE
         with self.assertRaises(TypeError):
             self.rule.check_node(node, self.context)
 
     def test_check_node_error_message_with_info_level(self):
         """Test detection of error message using info level."""
         code = "logger.info('An error occurred while processing')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -415,7 +392,7 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
     def test_check_node_warning_message_with_error_level(self):
         """Test detection of warning message using error level."""
         code = "logger.error('This is deprecated and will be removed')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -426,7 +403,7 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
     def test_check_node_success_message_with_info_level(self):
         """Test detection of success message using info level."""
         code = "logger.info('Operation completed successfully')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -435,7 +412,7 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
     def test_check_node_debug_message_with_info_level(self):
         """Test detection of debug message using info level."""
         code = "logger.info('Debug: variable state is active')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -453,14 +430,14 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
 
         for code in correct_cases:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 violations = self.rule.check_node(node, self.context)
                 self.assertEqual(len(violations), 0)
 
     def test_check_node_non_string_message(self):
         """Test handling of non-string message arguments."""
         code = "logger.info(123)"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         # Should not crash and return no violations
@@ -469,7 +446,7 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
     def test_check_node_no_args(self):
         """Test handling of logger calls with no arguments."""
         code = "logger.info()"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 0)
@@ -506,14 +483,14 @@ class TestLogLevelConsistencyRule(unittest.TestCase):
 
         for code in valid_calls:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertTrue(self.rule._is_logger_call(node))
 
         invalid_calls = ["logger.add('test')", "other.info('test')", "print('test')"]
 
         for code in invalid_calls:
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 self.assertFalse(self.rule._is_logger_call(node))
 
 
@@ -523,21 +500,13 @@ class TestLoguruConfigurationRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = LoguruConfigurationRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties are correctly defined."""
-        self.assertEqual(self.rule.rule_id, "logging.loguru-configuration")
-        self.assertEqual(self.rule.rule_name, "Loguru Configuration")
-        self.assertIn("proper loguru configuration", self.rule.description)
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"logging", "loguru", "configuration"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node(self):
         """Test should_check_node for logger.add calls."""
-        add_call = ast.parse("logger.add('file.log')").body[0].value
-        info_call = ast.parse("logger.info('test')").body[0].value
-        other_call = ast.parse("print('test')").body[0].value
+        add_call = ast.parse("logger.add('file.log')", mode="eval").body
+        info_call = _LOGGER_INFO_CALL_NODE
+        other_call = _PRINT_CALL_NODE
 
         self.assertTrue(self.rule.should_check_node(add_call, self.context))
         self.assertFalse(self.rule.should_check_node(info_call, self.context))
@@ -545,14 +514,14 @@ class TestLoguruConfigurationRule(unittest.TestCase):
 
     def test_check_node_non_call_raises_error(self):
         """Test that non-Call nodes raise TypeError."""
-        node = ast.parse("x = 1").body[0]
+        node = _ASSIGN_NODE
         with self.assertRaises(TypeError):
             self.rule.check_node(node, self.context)
 
     def test_check_node_no_sink_argument(self):
         """Test detection of logger.add() without sink argument."""
         code = "logger.add()"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -563,7 +532,7 @@ class TestLoguruConfigurationRule(unittest.TestCase):
     def test_check_node_file_sink_missing_options(self):
         """Test suggestions for missing configuration options with file sink."""
         code = "logger.add('app.log')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         # Should suggest all recommended options for file sinks
@@ -579,7 +548,7 @@ class TestLoguruConfigurationRule(unittest.TestCase):
     def test_check_node_file_sink_with_some_options(self):
         """Test that existing options are not suggested again."""
         code = "logger.add('app.log', level='INFO', rotation='1 MB')"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         # Should only suggest missing options
@@ -594,7 +563,7 @@ class TestLoguruConfigurationRule(unittest.TestCase):
 
         for code in stderr_cases[:2]:  # Skip sys.stderr as it's more complex to parse
             with self.subTest(code=code):
-                node = ast.parse(code).body[0].value
+                node = ast.parse(code, mode="eval").body
                 violations = self.rule.check_node(node, self.context)
                 self.assertEqual(len(violations), 0)
 
@@ -602,7 +571,7 @@ class TestLoguruConfigurationRule(unittest.TestCase):
         """Test that complete file configuration doesn't trigger violations."""
         code = """logger.add('app.log', level='INFO', format='{time} {level} {message}',
                             rotation='1 MB', retention='7 days')"""
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 0)
@@ -610,7 +579,7 @@ class TestLoguruConfigurationRule(unittest.TestCase):
     def test_check_node_variable_sink(self):
         """Test handling of variable as sink argument."""
         code = "logger.add(sink_variable)"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         # Should not suggest file-specific options for variable sinks
@@ -619,7 +588,7 @@ class TestLoguruConfigurationRule(unittest.TestCase):
     def test_check_node_function_call_sink(self):
         """Test handling of function call as sink argument."""
         code = "logger.add(get_sink())"
-        node = ast.parse(code).body[0].value
+        node = ast.parse(code, mode="eval").body
         violations = self.rule.check_node(node, self.context)
 
         # Should not suggest file-specific options for function call sinks
@@ -631,7 +600,7 @@ class TestRuleIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.context = LintContext(file_path=Path("/test.py"))
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_all_rules_implement_interface(self):
         """Test that all rules properly implement ASTLintRule interface."""
@@ -698,7 +667,7 @@ class TestRuleIntegration(unittest.TestCase):
         """Test that all rules create violations with consistent structure."""
         # Test UseLoguruRule violation creation
         rule = UseLoguruRule()
-        node = ast.parse("import logging").body[0]
+        node = _IMPORT_LOGGING_NODE
         violations = rule.check_node(node, self.context)
 
         if violations:
@@ -718,4 +687,6 @@ class TestRuleIntegration(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import pytest
+
+    sys.exit(pytest.main([__file__]))
@@ -15,36 +15,69 @@ Implementation: Production-ready tests with edge cases and error conditions
 import ast
 import sys
 import unittest
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List
+from unittest.mock import patch
 
-sys.path.insert(0, "/home/stevejackson/Projects/durable-code-test/tools")
-
-from design_linters.framework.interfaces import LintContext, LintViolation, Severity
+from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.literals.magic_number_rules import MagicComplexRule, MagicNumberRule
 
+# Non-test source path; files under test paths are exempt from these rules
+_SRC_PATH = Path("/src/main.py")
+_EXAMPLE_PATH = Path("/example.py")
+_TEST_MODULE_PATH = Path("/test_module.py")
+_TEST_PATH = Path("/test.py")
+
+
+def _call_stack(func_name: str, value: int) -> tuple[ast.AST, ...]:
+    """Build (module, call, constant); range detection looks for the call as the constant's parent."""
+    constant_node = ast.Constant(value=value)
+    call_node = ast.Call(func=ast.Name(id=func_name, ctx=ast.Load()), args=[constant_node], keywords=[])
+    return (ast.Module(body=[], type_ignores=[]), call_node, constant_node)
+
+
+def _binop_stack() -> tuple[ast.AST, ...]:
+    """Build (x + 42, 42) with the binary operation as the constant's parent."""
+    constant_node = ast.Constant(value=42)
+    return (ast.BinOp(left=ast.Name(id="x", ctx=ast.Load()), op=ast.Add(), right=constant_node), constant_node)
+
+
+# Parent stacks read by the context predicates; tests copy them into context.node_stack
+_RANGE_STACK = _call_stack("range", 5)
+_ENUMERATE_STACK = _call_stack("enumerate", 1)
+_BINOP_STACK = _binop_stack()
+
+# Standalone nodes for tests that hand a bare node to the rules, which only read them
+_CONSTANT_42 = ast.Constant(value=42)
+_NAME_X = ast.Name(id="x", ctx=ast.Load())
+
+
+@cache
+def _parse(code: str) -> ast.Module:
+    """Parse a snippet once; the rules only read the tree, so it is shared between contexts."""
+    return ast.parse(code)
+
+
+def _source_context(code: str, file_path: Path = _SRC_PATH) -> LintContext:
+    """Build a context from source alone, keeping file_content for ignore-directive checks."""
+    return LintContext(file_path=file_path, file_content=code, ast_tree=_parse(code), node_stack=[])
+
 
 class TestMagicNumberRule(unittest.TestCase):
     """Test cases for MagicNumberRule class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the rule once; its only state is a memo of generated suggestions."""
+        cls.rule = MagicNumberRule()
+
     def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.rule = MagicNumberRule()
-        self.context = LintContext(file_path=Path("/example.py"), node_stack=[])
-
-    def test_rule_properties(self):
-        """Test that rule properties return expected values."""
-        self.assertEqual(self.rule.rule_id, "literals.magic-number")
-        self.assertEqual(self.rule.rule_name, "Magic Number")
-        self.assertEqual(
-            self.rule.description, "Numeric literals should be replaced with named constants for better maintainability"
-        )
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"literals", "constants", "maintainability"})
+        """Give each test its own context, since tests push nodes and set metadata on it."""
+        self.context = LintContext(file_path=_EXAMPLE_PATH, node_stack=[])
 
     def test_should_check_node_with_integer_constant(self):
         """Test should_check_node returns True for integer constants."""
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         result = self.rule.should_check_node(node, self.context)
         self.assertTrue(result)
 
@@ -68,7 +101,7 @@ class TestMagicNumberRule(unittest.TestCase):
 
     def test_should_check_node_with_non_constant(self):
         """Test should_check_node returns False for non-constant nodes."""
-        node = ast.Name(id="x", ctx=ast.Load())
+        node = _NAME_X
         result = self.rule.should_check_node(node, self.context)
         self.assertFalse(result)
 
@@ -85,11 +118,11 @@ class TestMagicNumberRule(unittest.TestCase):
     def test_check_node_with_disallowed_number(self):
         """Test check_node returns violation for disallowed numbers."""
         # Set up context that won't trigger acceptable context exceptions
-        self.context.file_path = Path("/src/main.py")  # Not a test file
+        self.context.file_path = _SRC_PATH  # Not a test file
         self.context.current_function = "normal_function"  # Not config/setup/init
         self.context.node_stack = [ast.Constant(value=42)]  # Not in range or math context
 
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -103,14 +136,14 @@ class TestMagicNumberRule(unittest.TestCase):
     def test_check_node_with_custom_allowed_numbers(self):
         """Test check_node respects custom allowed numbers configuration."""
         # Set up context that won't trigger acceptable context exceptions
-        self.context.file_path = Path("/src/main.py")  # Not a test file
+        self.context.file_path = _SRC_PATH  # Not a test file
         self.context.current_function = "normal_function"  # Not config/setup/init
         self.context.node_stack = [ast.Constant(value=42)]  # Not in range or math context
 
         # Configure context with custom allowed numbers
         self.context.metadata = {"rules": {"literals.magic-number": {"config": {"allowed_numbers": {42, 100}}}}}
 
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
@@ -128,14 +161,14 @@ class TestMagicNumberRule(unittest.TestCase):
 
     def test_check_node_type_error(self):
         """Test check_node raises TypeError for non-constant nodes."""
-        node = ast.Name(id="x", ctx=ast.Load())
+        node = _NAME_X
         with self.assertRaises(TypeError):
             self.rule.check_node(node, self.context)
 
     def test_is_acceptable_context_test_file(self):
         """Test numbers are acceptable in test files."""
-        test_context = LintContext(file_path=Path("/test_module.py"))
-        node = ast.Constant(value=42)
+        test_context = LintContext(file_path=_TEST_MODULE_PATH)
+        node = _CONSTANT_42
         config = {}
 
         result = self.rule._is_acceptable_context(node, test_context, config)
@@ -144,7 +177,7 @@ class TestMagicNumberRule(unittest.TestCase):
     def test_is_acceptable_context_config_function(self):
         """Test numbers are acceptable in configuration functions."""
         self.context.current_function = "setup_config"
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         config = {}
 
         result = self.rule._is_acceptable_context(node, self.context, config)
@@ -153,7 +186,7 @@ class TestMagicNumberRule(unittest.TestCase):
     def test_is_acceptable_context_init_function(self):
         """Test numbers are acceptable in init functions."""
         self.context.current_function = "__init__"
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         config = {}
 
         result = self.rule._is_acceptable_context(node, self.context, config)
@@ -161,12 +194,8 @@ class TestMagicNumberRule(unittest.TestCase):
 
     def test_is_acceptable_context_small_int_in_range(self):
         """Test small integers are acceptable in range contexts."""
-        # Set up context with range function in node stack
-        node = ast.Constant(value=5)
-        range_node = ast.Call(func=ast.Name(id="range", ctx=ast.Load()), args=[node], keywords=[])
-        # Need at least 3 nodes for range context detection (dummy, range, constant)
-        dummy_node = ast.Module(body=[], type_ignores=[])
-        self.context.node_stack = [dummy_node, range_node, node]
+        self.context.node_stack = list(_RANGE_STACK)
+        node = _RANGE_STACK[-1]
         config = {"max_acceptable_small_int": 10}
 
         result = self.rule._is_acceptable_context(node, self.context, config)
@@ -174,10 +203,8 @@ class TestMagicNumberRule(unittest.TestCase):
 
     def test_is_acceptable_context_math_operation(self):
         """Test numbers are acceptable in mathematical operations."""
-        # Set up context with binary operation in node stack
-        node = ast.Constant(value=42)
-        binop_node = ast.BinOp(left=ast.Name(id="x", ctx=ast.Load()), op=ast.Add(), right=node)
-        self.context.node_stack = [binop_node, node]
+        self.context.node_stack = list(_BINOP_STACK)
+        node = _BINOP_STACK[-1]
         config = {}
 
         result = self.rule._is_acceptable_context(node, self.context, config)
@@ -186,11 +213,11 @@ class TestMagicNumberRule(unittest.TestCase):
     def test_is_acceptable_context_normal_case(self):
         """Test numbers are not acceptable in normal contexts."""
         # Set up context that doesn't match any exception patterns
-        self.context.file_path = Path("/src/main.py")  # Not a test file
+        self.context.file_path = _SRC_PATH  # Not a test file
         self.context.current_function = "normal_function"  # Not config/setup/init
         self.context.node_stack = [ast.Constant(value=42)]  # Not in range or math context
 
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         config = {}
 
         result = self.rule._is_acceptable_context(node, self.context, config)
@@ -198,24 +225,14 @@ class TestMagicNumberRule(unittest.TestCase):
 
     def test_is_in_range_context_with_range_call(self):
         """Test detection of range function context."""
-        # Create range call node and build proper stack
-        constant_node = ast.Constant(value=5)
-        range_node = ast.Call(func=ast.Name(id="range", ctx=ast.Load()), args=[constant_node], keywords=[])
-        # The stack should have nodes in order, with current node at the end
-        # For _is_in_range_context to find the range call at index -2, we need the range call as parent
-        dummy_node = ast.Module(body=[], type_ignores=[])
-        self.context.node_stack = [dummy_node, range_node, constant_node]
+        self.context.node_stack = list(_RANGE_STACK)
 
         result = self.rule._is_in_range_context(self.context)
         self.assertTrue(result)
 
     def test_is_in_range_context_with_enumerate_call(self):
         """Test detection of enumerate function context."""
-        constant_node = ast.Constant(value=1)
-        enum_node = ast.Call(func=ast.Name(id="enumerate", ctx=ast.Load()), args=[constant_node], keywords=[])
-        # Need at least 3 nodes for the algorithm to find the enumerate call at index -2
-        dummy_node = ast.Module(body=[], type_ignores=[])
-        self.context.node_stack = [dummy_node, enum_node, constant_node]
+        self.context.node_stack = list(_ENUMERATE_STACK)
 
         result = self.rule._is_in_range_context(self.context)
         self.assertTrue(result)
@@ -236,10 +253,7 @@ class TestMagicNumberRule(unittest.TestCase):
 
     def test_is_in_math_context_with_binop(self):
         """Test detection of binary operation context."""
-        constant_node = ast.Constant(value=42)
-        binop_node = ast.BinOp(left=ast.Name(id="x", ctx=ast.Load()), op=ast.Add(), right=constant_node)
-        # Stack should have binop as parent of constant (binop at -2, constant at -1)
-        self.context.node_stack = [binop_node, constant_node]
+        self.context.node_stack = list(_BINOP_STACK)
 
         result = self.rule._is_in_math_context(self.context)
         self.assertTrue(result)
@@ -333,12 +347,12 @@ class TestMagicNumberRule(unittest.TestCase):
     def test_violation_context_information(self):
         """Test that violations contain proper context information."""
         # Set up context that won't trigger acceptable context exceptions
-        self.context.file_path = Path("/src/main.py")  # Not a test file
+        self.context.file_path = _SRC_PATH  # Not a test file
         self.context.current_function = "normal_function"  # Not config/setup/init
         self.context.current_class = "TestClass"
         self.context.node_stack = [ast.Constant(value=42)]  # Not in range or math context
 
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         violations = self.rule.check_node(node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -355,18 +369,14 @@ class TestMagicNumberRule(unittest.TestCase):
 class TestMagicComplexRule(unittest.TestCase):
     """Test cases for MagicComplexRule class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the rule once; its only state is a memo of generated suggestions."""
+        cls.rule = MagicComplexRule()
+
     def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.rule = MagicComplexRule()
-        self.context = LintContext(file_path=Path("/example.py"), node_stack=[])
-
-    def test_rule_properties(self):
-        """Test that rule properties return expected values."""
-        self.assertEqual(self.rule.rule_id, "literals.magic-complex")
-        self.assertEqual(self.rule.rule_name, "Magic Complex Number")
-        self.assertEqual(self.rule.description, "Complex number literals should be replaced with named constants")
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"literals", "constants", "complex", "maintainability"})
+        """Give each test its own context, since tests push nodes and set metadata on it."""
+        self.context = LintContext(file_path=_EXAMPLE_PATH, node_stack=[])
 
     def test_should_check_node_with_complex_constant(self):
         """Test should_check_node returns True for complex constants."""
@@ -382,7 +392,7 @@ class TestMagicComplexRule(unittest.TestCase):
 
     def test_should_check_node_with_integer_constant(self):
         """Test should_check_node returns False for integer constants."""
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         result = self.rule.should_check_node(node, self.context)
         self.assertFalse(result)
 
@@ -422,13 +432,13 @@ class TestMagicComplexRule(unittest.TestCase):
 
     def test_check_node_with_non_complex_value(self):
         """Test check_node handles non-complex values gracefully."""
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
         violations = self.rule.check_node(node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_check_node_type_error(self):
         """Test check_node raises TypeError for non-constant nodes."""
-        node = ast.Name(id="x", ctx=ast.Load())
+        node = _NAME_X
         with self.assertRaises(TypeError):
             self.rule.check_node(node, self.context)
 
@@ -513,41 +523,63 @@ class TestMagicComplexRule(unittest.TestCase):
 class TestMagicNumberRuleIntegration(unittest.TestCase):
     """Integration tests for magic number rules with AST parsing."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.rule = MagicNumberRule()
+    @classmethod
+    def setUpClass(cls):
+        """Share one rule across the integration cases."""
+        cls.rule = MagicNumberRule()
 
     def test_real_code_analysis(self):
         """Test rule behavior with real Python code snippets."""
         code_snippets = [
             # Should trigger violation (use non-test file path)
-            ("x = 42", True, Path("/src/main.py")),
-            ("timeout = 30", True, Path("/src/main.py")),
-            ("buffer_size = 8192", True, Path("/src/main.py")),
+            ("x = 42", True, _SRC_PATH),
+            ("timeout = 30", True, _SRC_PATH),
+            ("buffer_size = 8192", True, _SRC_PATH),
             # Should not trigger violation (allowed numbers)
-            ("x = 0", False, Path("/src/main.py")),
-            ("y = 1", False, Path("/src/main.py")),
-            ("z = -1", False, Path("/src/main.py")),
+            ("x = 0", False, _SRC_PATH),
+            ("y = 1", False, _SRC_PATH),
+            ("z = -1", False, _SRC_PATH),
             # Should not trigger violation (test file)
             ("x = 42", False, Path("/tests/test_module.py")),
         ]
 
         for code, should_violate, file_path in code_snippets:
             with self.subTest(code=code):
-                tree = ast.parse(code)
-                context = LintContext(file_path=file_path, ast_tree=tree, file_content=code, node_stack=[])
+                context = _source_context(code, file_path)
 
-                violations = self.rule.check(context)
+                first_violation = next(self.rule.iter_violations(context), None)
                 if should_violate:
-                    self.assertGreater(len(violations), 0, f"Expected violation for: {code}")
+                    self.assertIsNotNone(first_violation, f"Expected violation for: {code}")
                 else:
-                    self.assertEqual(len(violations), 0, f"Unexpected violation for: {code}")
+                    self.assertIsNone(first_violation, f"Unexpected violation for: {code}")
+
+    def test_iter_violations_stops_at_first_hit(self):
+        """Test that stopping iteration early leaves the context stack unwound."""
+        code = "def connect():\n    timeout = 42\n    buffer_size = 8192\n"
+        context = _source_context(code)
+
+        violations = self.rule.iter_violations(context)
+        first_violation = next(violations)
+        violations.close()
+
+        self.assertEqual(first_violation.line, 2)
+        self.assertEqual(context.node_stack, [])
+        self.assertIsNone(context.current_function)
+
+    def test_check_without_source_skips_traversal(self):
+        """Test that a context without file content is not walked at all."""
+        context = LintContext(file_path=_SRC_PATH, ast_tree=_parse("x = 42"), node_stack=[])
+
+        with patch.object(self.rule, "should_check_node") as should_check_node:
+            violations = self.rule.check(context)
+
+        self.assertEqual(violations, [])
+        should_check_node.assert_not_called()
 
     def test_range_context_integration(self):
         """Test that numbers in range contexts are properly handled."""
         code = "for i in range(10): pass"
-        tree = ast.parse(code)
-        context = LintContext(file_path=Path("/test.py"), ast_tree=tree, node_stack=[])
+        context = _source_context(code, _TEST_PATH)
 
         violations = self.rule.check(context)
         # The 10 in range(10) should not trigger a violation
@@ -556,8 +588,7 @@ class TestMagicNumberRuleIntegration(unittest.TestCase):
     def test_math_operation_integration(self):
         """Test that numbers in math operations are properly handled."""
         code = "result = x + 42 * 2"
-        tree = ast.parse(code)
-        context = LintContext(file_path=Path("/src/main.py"), ast_tree=tree, node_stack=[])
+        context = _source_context(code)
 
         violations = self.rule.check(context)
         # Numbers in math operations should not trigger violations
@@ -567,9 +598,10 @@ class TestMagicNumberRuleIntegration(unittest.TestCase):
 class TestMagicComplexRuleIntegration(unittest.TestCase):
     """Integration tests for magic complex number rules with AST parsing."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.rule = MagicComplexRule()
+    @classmethod
+    def setUpClass(cls):
+        """Share one rule across the integration cases."""
+        cls.rule = MagicComplexRule()
 
     def test_real_code_analysis(self):
         """Test rule behavior with real Python code containing complex numbers."""
@@ -583,17 +615,15 @@ class TestMagicComplexRuleIntegration(unittest.TestCase):
 
         for code in code_snippets:
             with self.subTest(code=code):
-                tree = ast.parse(code)
-                context = LintContext(file_path=Path("/src/main.py"), ast_tree=tree, file_content=code, node_stack=[])
+                context = _source_context(code)
 
-                violations = self.rule.check(context)
-                self.assertGreater(len(violations), 0, f"Expected violation for: {code}")
+                first_violation = next(self.rule.iter_violations(context), None)
+                self.assertIsNotNone(first_violation, f"Expected violation for: {code}")
 
     def test_complex_math_operations(self):
         """Test complex numbers in mathematical operations."""
         code = "result = (2+3j) * (1-1j)"
-        tree = ast.parse(code)
-        context = LintContext(file_path=Path("/src/main.py"), ast_tree=tree, file_content=code, node_stack=[])
+        context = _source_context(code)
 
         violations = self.rule.check(context)
         # All complex literals should trigger violations
@@ -603,18 +633,24 @@ class TestMagicComplexRuleIntegration(unittest.TestCase):
 class TestEdgeCasesAndErrorConditions(unittest.TestCase):
     """Test edge cases and error conditions for both rules."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create both rules once; every test here only reads them."""
+        cls.number_rule = MagicNumberRule()
+        cls.complex_rule = MagicComplexRule()
+
     def test_magic_number_rule_with_none_context(self):
         """Test MagicNumberRule behavior with minimal context."""
-        rule = MagicNumberRule()
+        rule = self.number_rule
         context = LintContext()
-        node = ast.Constant(value=42)
+        node = _CONSTANT_42
 
         violations = rule.check_node(node, context)
         self.assertEqual(len(violations), 1)
 
     def test_magic_complex_rule_with_none_context(self):
         """Test MagicComplexRule behavior with minimal context."""
-        rule = MagicComplexRule()
+        rule = self.complex_rule
         context = LintContext()
         node = ast.Constant(value=1 + 2j)
 
@@ -623,7 +659,7 @@ class TestEdgeCasesAndErrorConditions(unittest.TestCase):
 
     def test_configuration_handling_edge_cases(self):
         """Test configuration handling with various edge cases."""
-        rule = MagicNumberRule()
+        rule = self.number_rule
 
         # Test with None metadata
         context = LintContext(metadata=None)
@@ -642,7 +678,7 @@ class TestEdgeCasesAndErrorConditions(unittest.TestCase):
 
     def test_node_stack_edge_cases(self):
         """Test behavior with various node stack configurations."""
-        rule = MagicNumberRule()
+        rule = self.number_rule
 
         # Test with None node stack
         context = LintContext(node_stack=None)
@@ -654,7 +690,7 @@ class TestEdgeCasesAndErrorConditions(unittest.TestCase):
 
     def test_numeric_edge_values(self):
         """Test behavior with edge numeric values."""
-        rule = MagicNumberRule()
+        rule = self.number_rule
         context = LintContext()
 
         # Test with very large numbers
@@ -674,7 +710,7 @@ class TestEdgeCasesAndErrorConditions(unittest.TestCase):
 
     def test_complex_number_edge_values(self):
         """Test complex rule behavior with edge values."""
-        rule = MagicComplexRule()
+        rule = self.complex_rule
         context = LintContext()
 
         # Test with very small real/imaginary parts
@@ -694,4 +730,6 @@ class TestEdgeCasesAndErrorConditions(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import pytest
+
+    sys.exit(pytest.main([__file__]))
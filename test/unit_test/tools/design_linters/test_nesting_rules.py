@@ -12,34 +12,110 @@ Implementation: Comprehensive test coverage using unittest framework with AST pa
 """
 
 import ast
+import copy
 import sys
+import textwrap
 import unittest
+from functools import cache
 from pathlib import Path
-from unittest.mock import Mock, patch
-
-sys.path.insert(0, "/home/stevejackson/Projects/durable-code-test/tools")
 
 from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.style.nesting_rules import DeepFunctionRule, ExcessiveNestingRule
 
+_TEST_PATH = Path("/test.py")
+
+
+@cache
+def _parse(code: str) -> ast.Module:
+    """Parse a test snippet once; tests that rewrite line numbers take a shallow copy of the node."""
+    return ast.parse(code)
+
+
+_SIMPLE_FUNCTION = """
+def simple_function():
+    x = 1
+    return x
+"""
+
+# Most nesting fixtures share an if/for/while shell (depth 4) and differ only in the innermost block
+_NEST_TEMPLATE = """
+def {name}():
+    if True:
+        for i in range(10):
+            while True:
+{inner}
+"""
+_TRY_EXCEPT = "try:\n    pass\nexcept:\n    pass"
+_TRY_WITH_EXCEPT = "try:\n    with open('file.txt') as f:\n        pass\nexcept:\n    pass"
+
+
+def _nested(name: str, inner: str = "break") -> str:
+    """Render a function whose innermost block sits inside the shared if/for/while shell."""
+    return _NEST_TEMPLATE.format(name=name, inner=textwrap.indent(inner, " " * 16))
+
+
+# (name, source) for functions that stay within the default limit of 4
+_NESTING_CASES: list[tuple[str, str]] = [
+    ("simple", _SIMPLE_FUNCTION),
+    ("moderate", _nested("moderate_nesting")),
+]
+
+# (name, source, expected depth); the function body itself counts as depth 1
+_DEPTH_CASES: list[tuple[str, str, int]] = [
+    ("simple", _SIMPLE_FUNCTION, 1),
+    (
+        # function(1) + if(2) + for(3) + while(4) + try(5) + with(6) + except+if(7)
+        "nested_constructs",
+        """
+def nested_constructs():
+    if True:
+        for i in range(10):
+            while True:
+                try:
+                    with open('file.txt') as f:
+                        pass
+                except Exception as e:
+                    if True:
+                        pass
+""",
+        7,
+    ),
+    (
+        "async_function",
+        """
+async def async_function():
+    async with some_context():
+        if True:
+            pass
+""",
+        3,
+    ),
+    (
+        # function(1) + match(2) + case(3) + if(4)
+        "match_statement",
+        """
+def match_function(value):
+    match value:
+        case 1:
+            if True:
+                pass
+""",
+        4,
+    ),
+]
+
 
 class TestExcessiveNestingRule(unittest.TestCase):
     """Test ExcessiveNestingRule functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the rule once; rules keep no state between checks."""
+        cls.rule = ExcessiveNestingRule()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.rule = ExcessiveNestingRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return expected values."""
-        self.assertEqual(self.rule.rule_id, "style.excessive-nesting")
-        self.assertEqual(self.rule.rule_name, "Excessive Nesting")
-        self.assertEqual(
-            self.rule.description, "Functions should not have excessive nesting depth for better readability"
-        )
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"style", "complexity", "readability"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_function_def(self):
         """Test should_check_node returns True for FunctionDef."""
@@ -86,51 +162,18 @@ class TestExcessiveNestingRule(unittest.TestCase):
 
         self.assertIn("ExcessiveNestingRule should only receive function nodes", str(cm.exception))
 
-    def test_check_node_simple_function_no_violations(self):
-        """Test check_node with simple function that has no violations."""
-        # Create a simple function with no nesting
-        func_code = """
-def simple_function():
-    x = 1
-    return x
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
-
-        violations = self.rule.check_node(func_node, self.context)
-        self.assertEqual(len(violations), 0)
-
-    def test_check_node_nested_function_no_violations(self):
-        """Test check_node with moderately nested function that doesn't exceed limit."""
-        # Create function with nesting depth 3 (within default limit of 4)
-        func_code = """
-def moderate_nesting():
-    if True:
-        for i in range(10):
-            while True:
-                break
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
-
-        violations = self.rule.check_node(func_node, self.context)
-        self.assertEqual(len(violations), 0)
+    def test_check_node_within_limit(self):
+        """Test check_node reports no violations for functions within the nesting limit."""
+        for name, source in _NESTING_CASES:
+            with self.subTest(name=name):
+                violations = self.rule.check_node(_parse(source).body[0], self.context)
+                self.assertEqual(len(violations), 0)
 
     def test_check_node_excessive_nesting_violation(self):
         """Test check_node with function that exceeds default nesting limit."""
         # Create function with nesting depth 6 (exceeds default limit of 4)
-        func_code = """
-def excessive_nesting():
-    if True:
-        for i in range(10):
-            while True:
-                try:
-                    with open('file.txt') as f:
-                        pass
-                except:
-                    pass
-"""
-        tree = ast.parse(func_code)
+        func_code = _nested("excessive_nesting", _TRY_WITH_EXCEPT)
+        tree = _parse(func_code)
         func_node = tree.body[0]
 
         violations = self.rule.check_node(func_node, self.context)
@@ -152,14 +195,8 @@ def excessive_nesting():
         self.context.metadata = {"rules": {"style.excessive-nesting": {"config": {"max_nesting_depth": 2}}}}
 
         # Create function with nesting depth 4 (should violate limit of 2)
-        func_code = """
-def custom_limit_violation():
-    if True:
-        for i in range(10):
-            while True:
-                break
-"""
-        tree = ast.parse(func_code)
+        func_code = _nested("custom_limit_violation")
+        tree = _parse(func_code)
         func_node = tree.body[0]
 
         violations = self.rule.check_node(func_node, self.context)
@@ -169,72 +206,11 @@ def custom_limit_violation():
         self.assertEqual(violation.context["depth"], 4)  # Actual depth is function(1) + if(2) + for(3) + while(4)
         self.assertEqual(violation.context["max_allowed"], 2)
 
-    def test_calculate_max_nesting_depth_simple(self):
-        """Test _calculate_max_nesting_depth with simple function."""
-        func_code = """
-def simple_function():
-    x = 1
-    return x
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
-
-        depth = self.rule._calculate_max_nesting_depth(func_node)
-        self.assertEqual(depth, 1)  # Function body is at depth 1
-
-    def test_calculate_max_nesting_depth_nested_constructs(self):
-        """Test _calculate_max_nesting_depth with various nested constructs."""
-        func_code = """
-def nested_constructs():
-    if True:                    # depth 2
-        for i in range(10):     # depth 3
-            while True:         # depth 4
-                try:            # depth 5
-                    with open('file.txt') as f:  # depth 6
-                        pass
-                except Exception as e:  # depth 5 (except handler)
-                    if True:    # depth 6
-                        pass
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
-
-        depth = self.rule._calculate_max_nesting_depth(func_node)
-        # The actual depth is 7: function(1) + if(2) + for(3) + while(4) + try(5) + with(6) + except+if(7)
-        self.assertEqual(depth, 7)
-
-    def test_calculate_max_nesting_depth_async_function(self):
-        """Test _calculate_max_nesting_depth with async function."""
-        func_code = """
-async def async_function():
-    async with some_context():
-        if True:
-            pass
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
-
-        depth = self.rule._calculate_max_nesting_depth(func_node)
-        self.assertEqual(depth, 3)  # async with + if
-
-    def test_calculate_max_nesting_depth_match_statement(self):
-        """Test _calculate_max_nesting_depth with match statement (Python 3.10+)."""
-        try:
-            func_code = """
-def match_function(value):
-    match value:
-        case 1:
-            if True:
-                pass
-"""
-            tree = ast.parse(func_code)
-            func_node = tree.body[0]
-
-            depth = self.rule._calculate_max_nesting_depth(func_node)
-            self.assertEqual(depth, 4)  # function(1) + match(2) + case(3) + if(4)
-        except SyntaxError:
-            # Skip test if running on Python < 3.10
-            self.skipTest("Match statements require Python 3.10+")
+    def test_calculate_max_nesting_depth_cases(self):
+        """Test _calculate_max_nesting_depth across plain, nested, async, and match constructs."""
+        for name, source, expected_depth in _DEPTH_CASES:
+            with self.subTest(name=name):
+                self.assertEqual(self.rule._calculate_max_nesting_depth(_parse(source).body[0]), expected_depth)
 
     def test_calculate_max_nesting_depth_invalid_node(self):
         """Test _calculate_max_nesting_depth with invalid node type."""
@@ -247,21 +223,8 @@ def match_function(value):
 
     def test_check_node_multiple_functions(self):
         """Test that each function is analyzed independently."""
-        func_code = """
-def function_with_violation():
-    if True:
-        for i in range(10):
-            while True:
-                try:
-                    with open('file.txt') as f:
-                        pass
-                except:
-                    pass
-
-def simple_function():
-    return 1
-"""
-        tree = ast.parse(func_code)
+        func_code = _nested("function_with_violation", _TRY_WITH_EXCEPT) + "\ndef simple_function():\n    return 1\n"
+        tree = _parse(func_code)
 
         # Test first function (should have violation)
         func1_node = tree.body[0]
@@ -277,20 +240,14 @@ def simple_function():
 class TestDeepFunctionRule(unittest.TestCase):
     """Test DeepFunctionRule functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the rule once; rules keep no state between checks."""
+        cls.rule = DeepFunctionRule()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.rule = DeepFunctionRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return expected values."""
-        self.assertEqual(self.rule.rule_id, "style.deep-function")
-        self.assertEqual(self.rule.rule_name, "Complex Function")
-        self.assertEqual(
-            self.rule.description, "Functions should not be overly complex with deep nesting and many lines"
-        )
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"style", "complexity", "maintainability"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_function_def(self):
         """Test should_check_node returns True for FunctionDef."""
@@ -344,8 +301,7 @@ def simple_function():
     x = 1
     return x
 """
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Set line numbers for length calculation
         func_node.lineno = 1
@@ -363,8 +319,7 @@ def long_function():
     line2 = 2
     # ... many more lines
 """
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Simulate a function that is 60 lines long (exceeds default limit of 50)
         func_node.lineno = 1
@@ -385,18 +340,8 @@ def long_function():
 
     def test_check_node_deep_nesting_violation(self):
         """Test check_node with function that exceeds nesting limit."""
-        func_code = """
-def deep_function():
-    if True:
-        for i in range(10):
-            while True:
-                try:
-                    pass
-                except:
-                    pass
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_code = _nested("deep_function", _TRY_EXCEPT)
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Set reasonable line numbers
         func_node.lineno = 1
@@ -417,18 +362,8 @@ def deep_function():
 
     def test_check_node_both_violations(self):
         """Test check_node with function that violates both length and nesting limits."""
-        func_code = """
-def complex_function():
-    if True:
-        for i in range(10):
-            while True:
-                try:
-                    pass
-                except:
-                    pass
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_code = _nested("complex_function", _TRY_EXCEPT)
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Set function to be both long and deeply nested
         func_node.lineno = 1
@@ -454,8 +389,7 @@ def custom_limit_function():
         for i in range(10):
             pass
 """
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Set line numbers to exceed custom limit
         func_node.lineno = 1
@@ -471,7 +405,7 @@ def simple_function():
     x = 1
     return x
 """
-        tree = ast.parse(func_code)
+        tree = _parse(func_code)
         func_node = tree.body[0]
 
         depth = self.rule._calculate_max_nesting_depth(func_node)
@@ -479,14 +413,8 @@ def simple_function():
 
     def test_calculate_max_nesting_depth_nested(self):
         """Test _calculate_max_nesting_depth with nested constructs."""
-        func_code = """
-def nested_function():
-    if True:
-        for i in range(10):
-            while True:
-                break
-"""
-        tree = ast.parse(func_code)
+        func_code = _nested("nested_function")
+        tree = _parse(func_code)
         func_node = tree.body[0]
 
         depth = self.rule._calculate_max_nesting_depth(func_node)
@@ -507,8 +435,7 @@ def nested_function():
 def function_without_lines():
     pass
 """
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Remove line number information
         func_node.lineno = None
@@ -524,8 +451,7 @@ def function_without_lines():
 def function_with_partial_lines():
     pass
 """
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Remove end line number information
         func_node.end_lineno = None
@@ -537,15 +463,8 @@ def function_with_partial_lines():
     def test_nesting_depth_difference_from_excessive_nesting_rule(self):
         """Test that DeepFunctionRule uses different nesting depth calculation."""
         # DeepFunctionRule doesn't include Match/match_case in nesting calculation
-        func_code = """
-def function_with_match():
-    if True:
-        for i in range(10):
-            while True:
-                break
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_code = _nested("function_with_match")
+        func_node = copy.copy(_parse(func_code).body[0])
 
         func_node.lineno = 1
         func_node.end_lineno = 5
@@ -563,11 +482,15 @@ def function_with_match():
 class TestNestingRulesIntegration(unittest.TestCase):
     """Integration tests for nesting rules."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create both rules once; neither keeps state between checks."""
+        cls.excessive_nesting_rule = ExcessiveNestingRule()
+        cls.deep_function_rule = DeepFunctionRule()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.excessive_nesting_rule = ExcessiveNestingRule()
-        self.deep_function_rule = DeepFunctionRule()
-        self.context = LintContext(file_path=Path("/test.py"))
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_both_rules_on_same_function(self):
         """Test both rules analyzing the same function."""
@@ -584,8 +507,7 @@ def complex_function():
                 except Exception as e:
                     pass
 """
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_node = copy.copy(_parse(func_code).body[0])
 
         # Set line numbers to make it long
         func_node.lineno = 1
@@ -612,15 +534,8 @@ def complex_function():
             }
         }
 
-        func_code = """
-def test_function():
-    if True:
-        for i in range(10):
-            while True:
-                break
-"""
-        tree = ast.parse(func_code)
-        func_node = tree.body[0]
+        func_code = _nested("test_function")
+        func_node = copy.copy(_parse(func_code).body[0])
         func_node.lineno = 1
         func_node.end_lineno = 5
 
@@ -635,4 +550,6 @@ def test_function():
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import pytest
+
+    sys.exit(pytest.main([__file__]))
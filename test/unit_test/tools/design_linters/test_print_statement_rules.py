@@ -14,39 +14,52 @@ Implementation: Comprehensive test coverage using unittest framework with AST pa
 import ast
 import sys
 import unittest
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict
 
-sys.path.insert(0, "/home/stevejackson/Projects/durable-code-test/tools")
-
-from design_linters.framework.interfaces import LintContext, LintViolation, Severity
+from design_linters.framework.interfaces import ASTLintRule, LintContext, Severity
 from design_linters.rules.style.print_statement_rules import ConsoleOutputRule, PrintStatementRule
 
+_SRC_PATH = Path("/src/module.py")
+_REGULAR_PATH = Path("/regular.py")
+_EXAMPLES_PATH = Path("/examples/demo.py")
+_TEST_MODULE_PATH = Path("/test_module.py")
+_TEST_PREFIX_PATH = Path("/test_something.py")
+_SCRIPT_PATH = Path("/scripts/utility.py")
+
+# Whole-module source for the full traversal test, parsed once at import
+_TRAVERSAL_SRC = """
+import sys
+print('hello')
+sys.stdout.write('world')
+console.log('debug')
+"""
+_TRAVERSAL_AST = ast.parse(_TRAVERSAL_SRC)
+
+
+@cache
+def _parse(code: str, mode: str = "exec") -> ast.AST:
+    """Parse a test snippet once; the rules under test never mutate the tree."""
+    return ast.parse(code, mode=mode)
+
 
 class TestPrintStatementRule(unittest.TestCase):
     """Test PrintStatementRule class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the rule once; rules keep no state between checks."""
+        cls.rule = PrintStatementRule()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.rule = PrintStatementRule()
-        self.context = LintContext(file_path=Path("/src/module.py"), file_content="", ast_tree=None, node_stack=[])
-
-    def test_rule_properties(self):
-        """Test rule property getters."""
-        self.assertEqual(self.rule.rule_id, "style.print-statement")
-        self.assertEqual(self.rule.rule_name, "Print Statement Usage")
-        self.assertEqual(
-            self.rule.description, "Print statements should be replaced with proper logging for production code"
-        )
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"style", "logging", "production"})
+        self.context = LintContext(file_path=_SRC_PATH, node_stack=[])
 
     def test_should_check_node_with_print_call(self):
         """Test should_check_node returns True for print() calls."""
         # Create a print() function call AST node
         code = "print('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value  # Extract the Call node
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertTrue(result)
@@ -55,8 +68,7 @@ class TestPrintStatementRule(unittest.TestCase):
         """Test should_check_node returns False for non-print function calls."""
         # Create a different function call AST node
         code = "len([1, 2, 3])"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value  # Extract the Call node
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertFalse(result)
@@ -65,8 +77,7 @@ class TestPrintStatementRule(unittest.TestCase):
         """Test should_check_node returns False for method calls."""
         # Create a method call AST node
         code = "obj.print('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value  # Extract the Call node
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertFalse(result)
@@ -75,7 +86,7 @@ class TestPrintStatementRule(unittest.TestCase):
         """Test should_check_node returns False for non-Call nodes."""
         # Create a Name node
         code = "print"
-        tree = ast.parse(code, mode="eval")
+        tree = _parse(code, mode="eval")
         name_node = tree.body  # Extract the Name node
 
         result = self.rule.should_check_node(name_node, self.context)
@@ -84,8 +95,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_check_node_with_print_call(self):
         """Test check_node detects print statement violation."""
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
 
@@ -100,7 +110,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_check_node_with_invalid_node_type(self):
         """Test check_node raises TypeError for non-Call nodes."""
         code = "print"
-        tree = ast.parse(code, mode="eval")
+        tree = _parse(code, mode="eval")
         name_node = tree.body  # Extract the Name node
 
         with self.assertRaises(TypeError) as cm:
@@ -111,11 +121,10 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_check_node_in_allowed_context_test_file(self):
         """Test check_node returns no violations in test files."""
         # Set context to a test file
-        self.context.file_path = Path("/test_module.py")
+        self.context.file_path = _TEST_MODULE_PATH
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -126,8 +135,7 @@ class TestPrintStatementRule(unittest.TestCase):
         self.context.current_function = "test_something"
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -138,8 +146,7 @@ class TestPrintStatementRule(unittest.TestCase):
         self.context.current_function = "__main__"
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -150,8 +157,7 @@ class TestPrintStatementRule(unittest.TestCase):
         self.context.current_function = "debug_output"
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -159,18 +165,17 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_check_node_in_allowed_context_example_file(self):
         """Test check_node returns no violations in example files."""
         # Set context to an example file
-        self.context.file_path = Path("/examples/demo.py")
+        self.context.file_path = _EXAMPLES_PATH
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_is_allowed_context_with_test_file(self):
         """Test _is_allowed_context returns True for test files."""
-        self.context.file_path = Path("/test_something.py")
+        self.context.file_path = _TEST_PREFIX_PATH
         config = {}
 
         result = self.rule._is_allowed_context(self.context, config)
@@ -187,8 +192,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_has_disable_comment(self):
         """Test _has_disable_comment method."""
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         # Current implementation always returns False
         result = self.rule._has_disable_comment(call_node, self.context)
@@ -197,8 +201,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_error_message(self):
         """Test _generate_logging_suggestion for error messages."""
         code = "print('Error occurred')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.error('Error occurred')")
@@ -206,8 +209,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_warning_message(self):
         """Test _generate_logging_suggestion for warning messages."""
         code = "print('Warning: this is deprecated')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.warning('Warning: this is deprecated')")
@@ -215,8 +217,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_info_message(self):
         """Test _generate_logging_suggestion for info messages."""
         code = "print('Starting process')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.info('Starting process')")
@@ -224,8 +225,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_debug_message(self):
         """Test _generate_logging_suggestion for regular messages."""
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.debug('hello world')")
@@ -233,8 +233,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_complex_call(self):
         """Test _generate_logging_suggestion for complex print calls."""
         code = "print(variable, 'text', 123)"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.info('...')  # Use appropriate logging level")
@@ -242,8 +241,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_no_args(self):
         """Test _generate_logging_suggestion for print with no args."""
         code = "print()"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.info('...')  # Use appropriate logging level")
@@ -251,8 +249,7 @@ class TestPrintStatementRule(unittest.TestCase):
     def test_generate_logging_suggestion_non_string_arg(self):
         """Test _generate_logging_suggestion for non-string arguments."""
         code = "print(42)"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         suggestion = self.rule._generate_logging_suggestion(call_node, self.context)
         self.assertEqual(suggestion, "logger.info('...')  # Use appropriate logging level")
@@ -263,8 +260,7 @@ class TestPrintStatementRule(unittest.TestCase):
         self.context.current_class = "MyClass"
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
 
@@ -288,8 +284,7 @@ class TestPrintStatementRule(unittest.TestCase):
         self.context.current_function = "custom_debug_function"
 
         code = "print('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -298,24 +293,19 @@ class TestPrintStatementRule(unittest.TestCase):
 class TestConsoleOutputRule(unittest.TestCase):
     """Test ConsoleOutputRule class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the rule once; rules keep no state between checks."""
+        cls.rule = ConsoleOutputRule()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.rule = ConsoleOutputRule()
-        self.context = LintContext(file_path=Path("/src/module.py"), file_content="", ast_tree=None, node_stack=[])
-
-    def test_rule_properties(self):
-        """Test rule property getters."""
-        self.assertEqual(self.rule.rule_id, "style.console-output")
-        self.assertEqual(self.rule.rule_name, "Console Output Usage")
-        self.assertEqual(self.rule.description, "Console output methods should be replaced with proper logging")
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"style", "logging", "console"})
+        self.context = LintContext(file_path=_SRC_PATH, node_stack=[])
 
     def test_should_check_node_with_sys_stdout_write(self):
         """Test should_check_node returns True for sys.stdout.write calls."""
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertTrue(result)
@@ -323,8 +313,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_should_check_node_with_sys_stderr_write(self):
         """Test should_check_node returns True for sys.stderr.write calls."""
         code = "sys.stderr.write('error')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertTrue(result)
@@ -332,8 +321,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_should_check_node_with_console_log(self):
         """Test should_check_node returns True for console.log calls."""
         code = "console.log('message')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertTrue(result)
@@ -341,8 +329,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_should_check_node_with_regular_function_call(self):
         """Test should_check_node returns False for regular function calls."""
         code = "print('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertFalse(result)
@@ -350,8 +337,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_should_check_node_with_other_sys_call(self):
         """Test should_check_node returns False for other sys calls."""
         code = "sys.exit(0)"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         result = self.rule.should_check_node(call_node, self.context)
         self.assertFalse(result)
@@ -359,7 +345,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_should_check_node_with_non_call_node(self):
         """Test should_check_node returns False for non-Call nodes."""
         code = "sys.stdout"
-        tree = ast.parse(code, mode="eval")
+        tree = _parse(code, mode="eval")
         attr_node = tree.body
 
         result = self.rule.should_check_node(attr_node, self.context)
@@ -368,8 +354,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_check_node_with_sys_stdout_write(self):
         """Test check_node detects sys.stdout.write violation."""
         code = "sys.stdout.write('hello world')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
 
@@ -384,8 +369,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_check_node_with_sys_stderr_write(self):
         """Test check_node detects sys.stderr.write violation."""
         code = "sys.stderr.write('error message')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
 
@@ -397,8 +381,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_check_node_with_console_log(self):
         """Test check_node detects console.log violation."""
         code = "console.log('message')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
 
@@ -410,7 +393,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_check_node_with_invalid_node_type(self):
         """Test check_node raises TypeError for non-Call nodes."""
         code = "sys.stdout"
-        tree = ast.parse(code, mode="eval")
+        tree = _parse(code, mode="eval")
         attr_node = tree.body
 
         with self.assertRaises(TypeError) as cm:
@@ -420,33 +403,30 @@ class TestConsoleOutputRule(unittest.TestCase):
 
     def test_check_node_in_allowed_context_test_file(self):
         """Test check_node returns no violations in test files."""
-        self.context.file_path = Path("/test_module.py")
+        self.context.file_path = _TEST_MODULE_PATH
 
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_check_node_in_allowed_context_example_file(self):
         """Test check_node returns no violations in example files."""
-        self.context.file_path = Path("/examples/demo.py")
+        self.context.file_path = _EXAMPLES_PATH
 
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_check_node_in_allowed_context_script_file(self):
         """Test check_node returns no violations in script files."""
-        self.context.file_path = Path("/scripts/utility.py")
+        self.context.file_path = _SCRIPT_PATH
 
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -456,8 +436,7 @@ class TestConsoleOutputRule(unittest.TestCase):
         self.context.current_function = "test_something"
 
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -467,8 +446,7 @@ class TestConsoleOutputRule(unittest.TestCase):
         self.context.current_function = "debug_something"
 
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -478,15 +456,14 @@ class TestConsoleOutputRule(unittest.TestCase):
         self.context.current_function = "main"
 
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         violations = self.rule.check_node(call_node, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_is_allowed_context_with_test_file(self):
         """Test _is_allowed_context returns True for test files."""
-        self.context.file_path = Path("/test_something.py")
+        self.context.file_path = _TEST_PREFIX_PATH
         config = {}
 
         result = self.rule._is_allowed_context(self.context, config)
@@ -510,7 +487,7 @@ class TestConsoleOutputRule(unittest.TestCase):
 
     def test_is_allowed_context_with_script_file(self):
         """Test _is_allowed_context returns True for script files."""
-        self.context.file_path = Path("/scripts/utility.py")
+        self.context.file_path = _SCRIPT_PATH
         config = {}
 
         result = self.rule._is_allowed_context(self.context, config)
@@ -518,7 +495,7 @@ class TestConsoleOutputRule(unittest.TestCase):
 
     def test_is_allowed_context_with_test_function(self):
         """Test _is_allowed_context returns True for test functions."""
-        self.context.file_path = Path("/regular.py")
+        self.context.file_path = _REGULAR_PATH
         self.context.current_function = "test_something"
         config = {}
 
@@ -527,7 +504,7 @@ class TestConsoleOutputRule(unittest.TestCase):
 
     def test_is_allowed_context_with_debug_function(self):
         """Test _is_allowed_context returns True for debug functions."""
-        self.context.file_path = Path("/regular.py")
+        self.context.file_path = _REGULAR_PATH
         self.context.current_function = "debug_something"
         config = {}
 
@@ -536,7 +513,7 @@ class TestConsoleOutputRule(unittest.TestCase):
 
     def test_is_allowed_context_with_main_function(self):
         """Test _is_allowed_context returns True for main function."""
-        self.context.file_path = Path("/regular.py")
+        self.context.file_path = _REGULAR_PATH
         self.context.current_function = "main"
         config = {}
 
@@ -545,7 +522,7 @@ class TestConsoleOutputRule(unittest.TestCase):
 
     def test_is_allowed_context_with_regular_context(self):
         """Test _is_allowed_context returns False for regular context."""
-        self.context.file_path = Path("/regular.py")
+        self.context.file_path = _REGULAR_PATH
         self.context.current_function = "regular_function"
         config = {}
 
@@ -555,8 +532,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_get_output_method_sys_stdout_write(self):
         """Test _get_output_method for sys.stdout.write."""
         code = "sys.stdout.write('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         method = self.rule._get_output_method(call_node)
         self.assertEqual(method, "sys.stdout.write")
@@ -564,8 +540,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_get_output_method_sys_stderr_write(self):
         """Test _get_output_method for sys.stderr.write."""
         code = "sys.stderr.write('error')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         method = self.rule._get_output_method(call_node)
         self.assertEqual(method, "sys.stderr.write")
@@ -573,8 +548,7 @@ class TestConsoleOutputRule(unittest.TestCase):
     def test_get_output_method_console_log(self):
         """Test _get_output_method for console.log."""
         code = "console.log('message')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         method = self.rule._get_output_method(call_node)
         self.assertEqual(method, "console.log")
@@ -583,8 +557,7 @@ class TestConsoleOutputRule(unittest.TestCase):
         """Test _get_output_method for unknown method."""
         # Create a function call that doesn't match expected patterns
         code = "unknown_func()"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
         method = self.rule._get_output_method(call_node)
         self.assertEqual(method, "unknown")
@@ -619,33 +592,29 @@ class TestConsoleOutputRule(unittest.TestCase):
 class TestRuleIntegration(unittest.TestCase):
     """Test integration between rules and framework."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one instance of each rule for the interface checks to share."""
+        cls.print_rule = PrintStatementRule()
+        cls.console_rule = ConsoleOutputRule()
+
     def test_both_rules_implement_astlintrule(self):
         """Test that both rules properly implement ASTLintRule interface."""
-        from design_linters.framework.interfaces import ASTLintRule
-
-        print_rule = PrintStatementRule()
-        console_rule = ConsoleOutputRule()
-
-        self.assertIsInstance(print_rule, ASTLintRule)
-        self.assertIsInstance(console_rule, ASTLintRule)
+        self.assertIsInstance(self.print_rule, ASTLintRule)
+        self.assertIsInstance(self.console_rule, ASTLintRule)
 
     def test_both_rules_have_unique_ids(self):
         """Test that both rules have unique rule IDs."""
-        print_rule = PrintStatementRule()
-        console_rule = ConsoleOutputRule()
-
-        self.assertNotEqual(print_rule.rule_id, console_rule.rule_id)
+        self.assertNotEqual(self.print_rule.rule_id, self.console_rule.rule_id)
 
     def test_create_violation_helper_method(self):
         """Test create_violation helper method works correctly."""
-        rule = PrintStatementRule()
-        context = LintContext(file_path=Path("/src/module.py"))
+        context = LintContext(file_path=_SRC_PATH)
 
         code = "print('hello')"
-        tree = ast.parse(code)
-        call_node = tree.body[0].value
+        call_node = _parse(code, mode="eval").body
 
-        violation = rule.create_violation(
+        violation = self.print_rule.create_violation(
             context=context,
             node=call_node,
             message="Test message",
@@ -664,48 +633,37 @@ class TestRuleIntegration(unittest.TestCase):
 
     def test_is_enabled_method(self):
         """Test is_enabled method works correctly."""
-        rule = PrintStatementRule()
-
         # Test with None config
-        self.assertTrue(rule.is_enabled(None))
+        self.assertTrue(self.print_rule.is_enabled(None))
 
         # Test with empty config
-        self.assertTrue(rule.is_enabled({}))
+        self.assertTrue(self.print_rule.is_enabled({}))
 
         # Test with rule enabled
         config = {"rules": {"style.print-statement": {"enabled": True}}}
-        self.assertTrue(rule.is_enabled(config))
+        self.assertTrue(self.print_rule.is_enabled(config))
 
         # Test with rule disabled
         config = {"rules": {"style.print-statement": {"enabled": False}}}
-        self.assertFalse(rule.is_enabled(config))
+        self.assertFalse(self.print_rule.is_enabled(config))
 
     def test_rules_work_with_ast_traversal(self):
         """Test that rules work properly with AST traversal."""
-        print_rule = PrintStatementRule()
-        console_rule = ConsoleOutputRule()
-
-        # Create a context with AST
-        code = """
-import sys
-print('hello')
-sys.stdout.write('world')
-console.log('debug')
-"""
-        tree = ast.parse(code)
-        context = LintContext(file_path=Path("/src/module.py"), file_content=code, ast_tree=tree)
+        context = LintContext(file_path=_SRC_PATH, file_content=_TRAVERSAL_SRC, ast_tree=_TRAVERSAL_AST)
 
         # Test print rule
-        print_violations = print_rule.check(context)
+        print_violations = self.print_rule.check(context)
         self.assertEqual(len(print_violations), 1)
         self.assertEqual(print_violations[0].rule_id, "style.print-statement")
 
         # Test console rule
-        console_violations = console_rule.check(context)
+        console_violations = self.console_rule.check(context)
         self.assertEqual(len(console_violations), 2)  # sys.stdout.write and console.log
         self.assertEqual(console_violations[0].rule_id, "style.console-output")
         self.assertEqual(console_violations[1].rule_id, "style.console-output")
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import pytest
+
+    sys.exit(pytest.main([__file__]))
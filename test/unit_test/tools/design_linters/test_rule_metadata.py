@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Purpose: Data-driven metadata tests for the AST-based design linter rules
+Scope: Rule identity properties for logging, loguru, SRP, literal, and style rules
+Overview: This module validates the static metadata every rule exposes to the framework: the
+    rule identifier used in configuration and ignore directives, the human-readable name, the
+    default severity, the category set used by the --categories filter, and the description
+    shown in reports. The expectations are kept in a single table so that each rule is checked
+    by one parametrized test instead of a dedicated test method per rule class, which keeps
+    the per-rule suites focused on detection behaviour.
+Dependencies: pytest, design_linters framework interfaces and rule modules
+Exports: RULE_METADATA_CASES, test_rule_metadata
+Interfaces: pytest parametrized test function
+Implementation: Parametrized over a module-level table of expected rule metadata
+"""
+
+import pytest
+from design_linters.framework.interfaces import Severity
+from design_linters.rules.literals.magic_number_rules import MagicComplexRule, MagicNumberRule
+from design_linters.rules.logging.general_logging_rules import (
+    LoggingInExceptionsRule,
+    NoPlainPrintRule,
+    ProperLogLevelsRule,
+)
+from design_linters.rules.logging.loguru_rules import (
+    LogLevelConsistencyRule,
+    LoguruConfigurationRule,
+    LoguruImportRule,
+    StructuredLoggingRule,
+    UseLoguruRule,
+)
+from design_linters.rules.solid.srp_rules import (
+    ClassTooBigRule,
+    LowCohesionRule,
+    TooManyDependenciesRule,
+    TooManyMethodsRule,
+    TooManyResponsibilitiesRule,
+)
+from design_linters.rules.style.nesting_rules import DeepFunctionRule, ExcessiveNestingRule
+from design_linters.rules.style.print_statement_rules import ConsoleOutputRule, PrintStatementRule
+
+# (rule class, rule_id, rule_name, severity, categories, description)
+RULE_METADATA_CASES = [
+    (
+        NoPlainPrintRule,
+        "logging.no-print",
+        "No Print Statements",
+        Severity.WARNING,
+        {"logging", "production", "anti-patterns"},
+        "Use proper logging instead of print statements for production code",
+    ),
+    (
+        ProperLogLevelsRule,
+        "logging.proper-levels",
+        "Proper Log Levels",
+        Severity.INFO,
+        {"logging", "best-practices", "levels"},
+        "Use appropriate log levels based on message importance and context",
+    ),
+    (
+        LoggingInExceptionsRule,
+        "logging.exception-logging",
+        "Exception Logging",
+        Severity.WARNING,
+        {"logging", "exceptions", "debugging"},
+        "Ensure proper logging in exception handlers with traceback information",
+    ),
+    (
+        UseLoguruRule,
+        "logging.use-loguru",
+        "Use Loguru for Logging",
+        Severity.INFO,
+        {"logging", "loguru", "best-practices"},
+        "Prefer loguru over standard logging for better functionality and ease of use",
+    ),
+    (
+        LoguruImportRule,
+        "logging.loguru-import",
+        "Proper Loguru Import",
+        Severity.WARNING,
+        {"logging", "loguru", "imports"},
+        "Import loguru logger using the recommended pattern",
+    ),
+    (
+        StructuredLoggingRule,
+        "logging.structured-logging",
+        "Structured Logging",
+        Severity.INFO,
+        {"logging", "loguru", "observability"},
+        "Use structured logging with context variables for better observability",
+    ),
+    (
+        LogLevelConsistencyRule,
+        "logging.log-level-consistency",
+        "Log Level Consistency",
+        Severity.INFO,
+        {"logging", "loguru", "consistency"},
+        "Use appropriate log levels consistently based on message content",
+    ),
+    (
+        LoguruConfigurationRule,
+        "logging.loguru-configuration",
+        "Loguru Configuration",
+        Severity.WARNING,
+        {"logging", "loguru", "configuration"},
+        "Ensure proper loguru configuration for production use",
+    ),
+    (
+        TooManyMethodsRule,
+        "solid.srp.too-many-methods",
+        "Too Many Methods",
+        Severity.WARNING,
+        {"solid", "srp", "complexity"},
+        "Classes should not have too many methods as it may indicate multiple responsibilities",
+    ),
+    (
+        TooManyResponsibilitiesRule,
+        "solid.srp.multiple-responsibilities",
+        "Multiple Responsibilities",
+        Severity.ERROR,
+        {"solid", "srp"},
+        "Classes should have a single responsibility based on method naming patterns",
+    ),
+    (
+        LowCohesionRule,
+        "solid.srp.low-cohesion",
+        "Low Cohesion",
+        Severity.WARNING,
+        {"solid", "srp", "cohesion"},
+        "Classes should have high cohesion with methods using shared instance variables",
+    ),
+    (
+        ClassTooBigRule,
+        "solid.srp.class-too-big",
+        "Class Too Big",
+        Severity.INFO,
+        {"solid", "srp", "size"},
+        "Classes should not be excessively large as it may indicate multiple responsibilities",
+    ),
+    (
+        TooManyDependenciesRule,
+        "solid.srp.too-many-dependencies",
+        "Too Many Dependencies",
+        Severity.WARNING,
+        {"solid", "srp", "dependencies"},
+        "Classes should not have excessive dependencies as it may indicate multiple responsibilities",
+    ),
+    (
+        MagicNumberRule,
+        "literals.magic-number",
+        "Magic Number",
+        Severity.WARNING,
+        {"literals", "constants", "maintainability"},
+        "Numeric literals should be replaced with named constants for better maintainability",
+    ),
+    (
+        MagicComplexRule,
+        "literals.magic-complex",
+        "Magic Complex Number",
+        Severity.WARNING,
+        {"literals", "constants", "complex", "maintainability"},
+        "Complex number literals should be replaced with named constants",
+    ),
+    (
+        ExcessiveNestingRule,
+        "style.excessive-nesting",
+        "Excessive Nesting",
+        Severity.WARNING,
+        {"style", "complexity", "readability"},
+        "Functions should not have excessive nesting depth for better readability",
+    ),
+    (
+        DeepFunctionRule,
+        "style.deep-function",
+        "Complex Function",
+        Severity.INFO,
+        {"style", "complexity", "maintainability"},
+        "Functions should not be overly complex with deep nesting and many lines",
+    ),
+    (
+        PrintStatementRule,
+        "style.print-statement",
+        "Print Statement Usage",
+        Severity.WARNING,
+        {"style", "logging", "production"},
+        "Print statements should be replaced with proper logging for production code",
+    ),
+    (
+        ConsoleOutputRule,
+        "style.console-output",
+        "Console Output Usage",
+        Severity.INFO,
+        {"style", "logging", "console"},
+        "Console output methods should be replaced with proper logging",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "rule_cls,rule_id,rule_name,severity,categories,description",
+    RULE_METADATA_CASES,
+    ids=[case[1] for case in RULE_METADATA_CASES],
+)
+def test_rule_metadata(rule_cls, rule_id, rule_name, severity, categories, description):
+    """Test rule properties return the expected metadata."""
+    rule = rule_cls()
+    assert rule.rule_id == rule_id
+    assert rule.rule_name == rule_name
+    assert rule.severity == severity
+    assert rule.categories == categories
+    assert rule.description == description
@@ -12,14 +12,13 @@ Implementation: Comprehensive test coverage using unittest framework with AST pa
 """
 
 import ast
+import re
 import sys
 import unittest
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List
 
-sys.path.insert(0, "/home/stevejackson/Projects/durable-code-test/tools")
-
-from design_linters.framework.interfaces import LintContext, LintViolation, Severity
+from design_linters.framework.interfaces import LintContext, Severity
 from design_linters.rules.solid.srp_rules import (
     ClassTooBigRule,
     LowCohesionRule,
@@ -28,6 +27,30 @@ from design_linters.rules.solid.srp_rules import (
     TooManyResponsibilitiesRule,
 )
 
+_TEST_PATH = Path("/test.py")
+_EMPTY_CLASS_CODE = "class EmptyClass:\n    pass"
+# Shared by the method-count and cohesion suites, which only read it
+_EMPTY_CLASS_NODE = ast.parse(_EMPTY_CLASS_CODE).body[0]
+
+# Expected violation messages, each checked in one match instead of a chain of substring asserts
+_TOO_MANY_METHODS_MESSAGE = re.compile(r"'LargeClass' has 20 methods \(max: 15\)")
+_RESPONSIBILITIES_MESSAGE = re.compile(r"'MixedClass' has \d+ responsibility groups")
+_LOW_COHESION_MESSAGE = re.compile(r"'LowCohesionClass' has low cohesion")
+_CLASS_TOO_BIG_MESSAGE = re.compile(r"'LargeClass' is large \(249 lines\)")
+_DEPENDENCIES_MESSAGE = re.compile(r"'DependentClass' has \d+ dependencies")
+
+
+@cache
+def _parse(code: str) -> ast.Module:
+    """Parse a class snippet once; the SRP rules only read the trees they are given."""
+    return ast.parse(code)
+
+
+def _parse_class(name: str, body_lines: list[str]) -> ast.ClassDef:
+    """Parse a class whose body is the given lines, each indented one level."""
+    body = "\n".join(f"    {line}" for line in body_lines)
+    return _parse(f"class {name}:\n{body}\n").body[0]
+
 
 class TestTooManyMethodsRule(unittest.TestCase):
     """Test suite for TooManyMethodsRule."""
@@ -35,15 +58,7 @@ class TestTooManyMethodsRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = TooManyMethodsRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return correct values."""
-        self.assertEqual(self.rule.rule_id, "solid.srp.too-many-methods")
-        self.assertEqual(self.rule.rule_name, "Too Many Methods")
-        self.assertIn("too many methods", self.rule.description.lower())
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"solid", "srp", "complexity"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_with_class_def(self):
         """Test should_check_node returns True for ClassDef nodes."""
@@ -88,7 +103,7 @@ class SmallClass:
     def method3(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -96,22 +111,14 @@ class SmallClass:
     def test_class_with_many_methods_violation(self):
         """Test class with many methods produces violation."""
         # Create a class with more than 15 methods (default threshold)
-        methods = [f"    def method{i}(self): pass" for i in range(20)]
-        code = f"""
-class LargeClass:
-{chr(10).join(methods)}
-"""
-        tree = ast.parse(code)
-        class_node = tree.body[0]
+        class_node = _parse_class("LargeClass", [f"def method{i}(self): pass" for i in range(20)])
         violations = self.rule.check_node(class_node, self.context)
 
         self.assertEqual(len(violations), 1)
         violation = violations[0]
         self.assertEqual(violation.rule_id, "solid.srp.too-many-methods")
         self.assertEqual(violation.severity, Severity.WARNING)
-        self.assertIn("LargeClass", violation.message)
-        self.assertIn("20 methods", violation.message)
-        self.assertIn("max: 15", violation.message)
+        self.assertRegex(violation.message, _TOO_MANY_METHODS_MESSAGE)
 
     def test_custom_max_methods_configuration(self):
         """Test custom max_methods configuration is respected."""
@@ -119,13 +126,7 @@ class LargeClass:
         self.context.metadata = {"rules": {"solid.srp.too-many-methods": {"config": {"max_methods": 5}}}}
 
         # Create a class with 7 methods (above custom threshold)
-        methods = [f"    def method{i}(self): pass" for i in range(7)]
-        code = f"""
-class ModerateClass:
-{chr(10).join(methods)}
-"""
-        tree = ast.parse(code)
-        class_node = tree.body[0]
+        class_node = _parse_class("ModerateClass", [f"def method{i}(self): pass" for i in range(7)])
         violations = self.rule.check_node(class_node, self.context)
 
         self.assertEqual(len(violations), 1)
@@ -133,13 +134,7 @@ class ModerateClass:
 
     def test_class_with_no_methods(self):
         """Test class with no methods produces no violations."""
-        code = """
-class EmptyClass:
-    pass
-"""
-        tree = ast.parse(code)
-        class_node = tree.body[0]
-        violations = self.rule.check_node(class_node, self.context)
+        violations = self.rule.check_node(_EMPTY_CLASS_NODE, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_class_with_non_method_body_items(self):
@@ -156,7 +151,7 @@ class MixedClass:
     def method2(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -168,15 +163,7 @@ class TestTooManyResponsibilitiesRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = TooManyResponsibilitiesRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return correct values."""
-        self.assertEqual(self.rule.rule_id, "solid.srp.multiple-responsibilities")
-        self.assertEqual(self.rule.rule_name, "Multiple Responsibilities")
-        self.assertIn("single responsibility", self.rule.description.lower())
-        self.assertEqual(self.rule.severity, Severity.ERROR)
-        self.assertEqual(self.rule.categories, {"solid", "srp"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_with_class_def(self):
         """Test should_check_node returns True for ClassDef nodes."""
@@ -213,7 +200,7 @@ class DataHandler:
     def load_data(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -234,7 +221,7 @@ class MixedClass:
     def calculate_sum(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
 
@@ -242,8 +229,7 @@ class MixedClass:
         violation = violations[0]
         self.assertEqual(violation.rule_id, "solid.srp.multiple-responsibilities")
         self.assertEqual(violation.severity, Severity.ERROR)
-        self.assertIn("MixedClass", violation.message)
-        self.assertIn("responsibility groups", violation.message)
+        self.assertRegex(violation.message, _RESPONSIBILITIES_MESSAGE)
 
     def test_private_methods_ignored(self):
         """Test private methods (starting with _) are ignored."""
@@ -261,7 +247,7 @@ class TestClass:
     def validate_input(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
 
@@ -282,7 +268,7 @@ class TestClass:
     def validate_input(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
 
@@ -311,7 +297,7 @@ class TestClass:
     def process_data(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
 
@@ -370,15 +356,7 @@ class TestLowCohesionRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = LowCohesionRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return correct values."""
-        self.assertEqual(self.rule.rule_id, "solid.srp.low-cohesion")
-        self.assertEqual(self.rule.rule_name, "Low Cohesion")
-        self.assertIn("high cohesion", self.rule.description.lower())
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"solid", "srp", "cohesion"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_with_class_def(self):
         """Test should_check_node returns True for ClassDef nodes."""
@@ -401,13 +379,7 @@ class TestLowCohesionRule(unittest.TestCase):
 
     def test_class_with_no_methods_no_violation(self):
         """Test class with no methods produces no violations."""
-        code = """
-class EmptyClass:
-    pass
-"""
-        tree = ast.parse(code)
-        class_node = tree.body[0]
-        violations = self.rule.check_node(class_node, self.context)
+        violations = self.rule.check_node(_EMPTY_CLASS_NODE, self.context)
         self.assertEqual(len(violations), 0)
 
     def test_class_with_no_instance_vars_no_violation(self):
@@ -421,7 +393,7 @@ class NoInstanceVars:
     def method2(self):
         return "test"
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -444,7 +416,7 @@ class HighCohesionClass:
     def get_data(self):
         return self.data
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -477,7 +449,7 @@ class LowCohesionClass:
         # This method also doesn't use any instance variables
         return 42
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
 
@@ -487,8 +459,7 @@ class LowCohesionClass:
         violation = violations[0]
         self.assertEqual(violation.rule_id, "solid.srp.low-cohesion")
         self.assertEqual(violation.severity, Severity.WARNING)
-        self.assertIn("LowCohesionClass", violation.message)
-        self.assertIn("low cohesion", violation.message)
+        self.assertRegex(violation.message, _LOW_COHESION_MESSAGE)
 
     def test_custom_min_cohesion_configuration(self):
         """Test custom min_cohesion_score configuration."""
@@ -509,7 +480,7 @@ class ModeratelyCohesiveClass:
     def method3(self):
         return self.other_var
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         violations = self.rule.check_node(class_node, self.context)
 
@@ -530,7 +501,7 @@ class TestClass:
         local_var = 4  # Should not be included
         other.attribute = 5  # Should not be included
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         instance_vars = self.rule._extract_instance_variables(class_node)
 
@@ -546,7 +517,7 @@ def test_method(self):
     local_var = self.var1
     return result
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         method_node = tree.body[0]
         instance_vars = {"var1", "var2", "var3", "var4"}
 
@@ -577,15 +548,7 @@ class TestClassTooBigRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = ClassTooBigRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return correct values."""
-        self.assertEqual(self.rule.rule_id, "solid.srp.class-too-big")
-        self.assertEqual(self.rule.rule_name, "Class Too Big")
-        self.assertIn("excessively large", self.rule.description.lower())
-        self.assertEqual(self.rule.severity, Severity.INFO)
-        self.assertEqual(self.rule.categories, {"solid", "srp", "size"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_with_class_def(self):
         """Test should_check_node returns True for ClassDef nodes."""
@@ -629,8 +592,7 @@ class TestClassTooBigRule(unittest.TestCase):
         violation = violations[0]
         self.assertEqual(violation.rule_id, "solid.srp.class-too-big")
         self.assertEqual(violation.severity, Severity.INFO)
-        self.assertIn("LargeClass", violation.message)
-        self.assertIn("249 lines", violation.message)
+        self.assertRegex(violation.message, _CLASS_TOO_BIG_MESSAGE)
 
     def test_custom_max_lines_configuration(self):
         """Test custom max_class_lines configuration."""
@@ -669,15 +631,7 @@ class TestTooManyDependenciesRule(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.rule = TooManyDependenciesRule()
-        self.context = LintContext(file_path=Path("/test.py"))
-
-    def test_rule_properties(self):
-        """Test rule properties return correct values."""
-        self.assertEqual(self.rule.rule_id, "solid.srp.too-many-dependencies")
-        self.assertEqual(self.rule.rule_name, "Too Many Dependencies")
-        self.assertIn("excessive dependencies", self.rule.description.lower())
-        self.assertEqual(self.rule.severity, Severity.WARNING)
-        self.assertEqual(self.rule.categories, {"solid", "srp", "dependencies"})
+        self.context = LintContext(file_path=_TEST_PATH)
 
     def test_should_check_node_with_class_def(self):
         """Test should_check_node returns True for ClassDef nodes."""
@@ -709,7 +663,7 @@ class SimpleClass:
     def method(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[3]  # Class is the 4th statement
         violations = self.rule.check_node(class_node, self.context)
         self.assertEqual(len(violations), 0)
@@ -717,24 +671,15 @@ class SimpleClass:
     def test_class_with_many_dependencies_violation(self):
         """Test class with many dependencies produces violation."""
         # Create a class with many import statements within the class
-        imports = [f"    import module{i}" for i in range(15)]
-        code = f"""
-class DependentClass:
-{chr(10).join(imports)}
-
-    def method(self):
-        pass
-"""
-        tree = ast.parse(code)
-        class_node = tree.body[0]  # Class is the first statement
+        imports = [f"import module{i}" for i in range(15)]
+        class_node = _parse_class("DependentClass", [*imports, "def method(self): pass"])
         violations = self.rule.check_node(class_node, self.context)
 
         self.assertEqual(len(violations), 1)
         violation = violations[0]
         self.assertEqual(violation.rule_id, "solid.srp.too-many-dependencies")
         self.assertEqual(violation.severity, Severity.WARNING)
-        self.assertIn("DependentClass", violation.message)
-        self.assertIn("dependencies", violation.message)
+        self.assertRegex(violation.message, _DEPENDENCIES_MESSAGE)
 
     def test_custom_max_dependencies_configuration(self):
         """Test custom max_dependencies configuration."""
@@ -750,7 +695,7 @@ class ModerateClass:
     def method(self):
         pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]  # Class is the first statement
         violations = self.rule.check_node(class_node, self.context)
 
@@ -766,7 +711,7 @@ class TestClass:
     from collections.abc import Mapping
     pass
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]  # Class is the first statement
         dependencies = self.rule._extract_dependencies(class_node)
 
@@ -785,7 +730,7 @@ class TestClass:
         import sys
         from collections import defaultdict
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         dependencies = self.rule._extract_dependencies(class_node)
 
@@ -801,7 +746,7 @@ class SimpleClass:
         x = 1 + 1
         return x
 """
-        tree = ast.parse(code)
+        tree = _parse(code)
         class_node = tree.body[0]
         dependencies = self.rule._extract_dependencies(class_node)
 
@@ -820,4 +765,6 @@ class SimpleClass:
 
 
 if __name__ == "__main__":
-    unittest.main()
+    import pytest
+
+    sys.exit(pytest.main([__file__]))
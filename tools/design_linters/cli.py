@@ -17,6 +17,7 @@ import datetime
 import json
 import sys
 import traceback
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -36,6 +37,9 @@ DEFAULT_LINE_SEPARATOR_LENGTH = 40
 class ArgumentParser:  # design-lint: ignore[solid.srp.low-cohesion]
     """Handles command-line argument parsing and configuration management."""
 
+    # Built on first use and shared by every instance, since parsing never modifies it
+    _parser: argparse.ArgumentParser | None = None
+
     def _create_parser(self) -> argparse.ArgumentParser:
         """Create and configure the argument parser."""
         return argparse.ArgumentParser(
@@ -111,14 +115,21 @@ Examples:
         )
         parser.add_argument("--config", help="Path to configuration file")
 
+    def _get_parser(self) -> argparse.ArgumentParser:
+        """Build the argument parser on first use and reuse it for later calls."""
+        cls = type(self)
+        if cls._parser is None:
+            parser = self._create_parser()
+            self._add_input_arguments(parser)
+            self._add_output_arguments(parser)
+            self._add_rule_arguments(parser)
+            self._add_mode_arguments(parser)
+            cls._parser = parser
+        return cls._parser
+
     def parse_arguments(self, args: list[str]) -> argparse.Namespace:
         """Parse command-line arguments."""
-        parser = self._create_parser()
-        self._add_input_arguments(parser)
-        self._add_output_arguments(parser)
-        self._add_rule_arguments(parser)
-        self._add_mode_arguments(parser)
-        return parser.parse_args(args)
+        return self._get_parser().parse_args(args)
 
 
 class ConfigurationLoader:
@@ -287,12 +298,11 @@ class RuleListManager:
         print("📁 Available Rule Categories")
         print("=" * DEFAULT_LINE_SEPARATOR_LENGTH)
         rules = orchestrator.get_rule_registry().get_all_rules()
-        categories = set()
+        counts: Counter[str] = Counter()
         for rule in rules:
-            categories.update(rule.categories or ["uncategorized"])
-        for category in sorted(categories):
-            count = len([r for r in rules if category in (r.categories or ["uncategorized"])])
-            print(f"  📂 {category} ({count} rules)")
+            counts.update(set(rule.categories or ["uncategorized"]))
+        for category in sorted(counts):
+            print(f"  📂 {category} ({counts[category]} rules)")
 
 
 class OutputManager:
@@ -320,8 +330,7 @@ class OutputManager:
     def _write_report_to_file(self, report: str, args: argparse.Namespace) -> None:
         """Write report to specified file."""
         try:
-            with open(args.output, "w", encoding="utf-8") as f:
-                f.write(report)
+            Path(args.output).write_text(report, encoding="utf-8")
             logger.info("Report written to {}", args.output)
         except OSError as e:
             logger.exception("Error writing to {}: {}", args.output, e)
@@ -334,10 +343,15 @@ class LintingExecutor:
         self.orchestrator: LintOrchestrator | None = None
         self.files_analyzed: int = 0
 
-    def execute_linting(self, args: argparse.Namespace) -> tuple[list[LintViolation], dict[str, Any]]:
-        """Execute linting on specified paths and return violations with metadata."""
+    def execute_linting(
+        self, args: argparse.Namespace, orchestrator: LintOrchestrator | None = None
+    ) -> tuple[list[LintViolation], dict[str, Any]]:
+        """Execute linting on specified paths and return violations with metadata.
+
+        An orchestrator the caller has already built is reused instead of creating a second one.
+        """
         config = ConfigurationManager().load_configuration(args)
-        self.orchestrator = self._create_orchestrator(args)
+        self.orchestrator = orchestrator if orchestrator is not None else self._create_orchestrator(args)
 
         paths = [Path(p) for p in args.paths] if args.paths else [Path(".")]
         violations = self._lint_all_paths(paths, config, args)
@@ -435,7 +449,7 @@ class DesignLinterCLI:  # design-lint: ignore[solid.srp.low-cohesion]
             self.rule_list_manager.list_categories(orchestrator)
             return 0
 
-        violations, metadata = self.linting_executor.execute_linting(parsed_args)
+        violations, metadata = self.linting_executor.execute_linting(parsed_args, orchestrator)
         self.output_manager.output_results(violations, metadata, parsed_args)
 
         return self._determine_exit_code(violations, parsed_args)
@@ -19,6 +19,7 @@ Implementation: Visitor pattern with plugin architecture coordination
 """
 
 import ast
+import fnmatch
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -28,6 +29,7 @@ from loguru import logger
 from .interfaces import (
     ASTLintRule,
     ConfigurationProvider,
+    FileBasedLintRule,
     LintAnalyzer,
     LintContext,
     LintOrchestrator,
@@ -36,6 +38,7 @@ from .interfaces import (
     LintViolation,
     RuleRegistry,
     has_file_level_ignore,
+    parse_ignore_directives,
     should_ignore_node,
     update_context_for_node,
 )
@@ -58,11 +61,22 @@ class PythonAnalyzer(LintAnalyzer):
             logger.exception("Error analyzing {}", file_path)
             return self._handle_analysis_error(file_path)
 
+    def analyze_source(self, content: str, file_path: Path) -> LintContext:
+        """Analyze Python source already in memory, using file_path only for naming and reporting."""
+        try:
+            return self._parse_content(content, file_path)
+        except SyntaxError as e:
+            return self._handle_syntax_error(file_path, e)
+
     def _parse_file_successfully(self, file_path: Path) -> LintContext:
         """Parse a file successfully and return context."""
         with open(file_path, encoding="utf-8") as file:
             content = file.read()
 
+        return self._parse_content(content, file_path)
+
+    def _parse_content(self, content: str, file_path: Path) -> LintContext:
+        """Parse source content and return context with ignore directives applied."""
         ast_tree = ast.parse(content, filename=str(file_path))
 
         context = LintContext(
@@ -75,8 +89,6 @@ class PythonAnalyzer(LintAnalyzer):
         )
 
         # Parse ignore directives
-        from .interfaces import parse_ignore_directives  # pylint: disable=import-outside-toplevel
-
         parse_ignore_directives(content, context)
         return context
 
@@ -253,19 +265,17 @@ class _FileDiscoveryService:
         recursive: bool,
     ) -> list[Path]:
         """Find files to analyze based on patterns."""
-        import fnmatch  # pylint: disable=import-outside-toplevel
-
         files = []
         pattern = "**/*" if recursive else "*"
 
         for path in directory.glob(pattern):
-            if self._should_analyze_path(path, directory, include_patterns, exclude_patterns, fnmatch=fnmatch):
+            if self._should_analyze_path(path, directory, include_patterns, exclude_patterns):
                 files.append(path)
 
         return files
 
     def _should_analyze_path(
-        self, path: Path, directory: Path, include_patterns: list[str], exclude_patterns: list[str], *, fnmatch: Any
+        self, path: Path, directory: Path, include_patterns: list[str], exclude_patterns: list[str]
     ) -> bool:
         """Determine if a path should be analyzed based on patterns."""
         if not path.is_file():
@@ -273,16 +283,16 @@ class _FileDiscoveryService:
 
         relative_path = path.relative_to(directory)
 
-        if not self._matches_include_patterns(relative_path, include_patterns, fnmatch):
+        if not self._matches_include_patterns(relative_path, include_patterns):
             return False
 
-        return not self._matches_exclude_patterns(relative_path, exclude_patterns, fnmatch)
+        return not self._matches_exclude_patterns(relative_path, exclude_patterns)
 
-    def _matches_include_patterns(self, relative_path: Path, include_patterns: list[str], fnmatch: Any) -> bool:
+    def _matches_include_patterns(self, relative_path: Path, include_patterns: list[str]) -> bool:
         """Check if path matches include patterns."""
         return any(fnmatch.fnmatch(str(relative_path), pattern) for pattern in include_patterns)
 
-    def _matches_exclude_patterns(self, relative_path: Path, exclude_patterns: list[str], fnmatch: Any) -> bool:
+    def _matches_exclude_patterns(self, relative_path: Path, exclude_patterns: list[str]) -> bool:
         """Check if path matches exclude patterns."""
         return any(fnmatch.fnmatch(str(relative_path), pattern) for pattern in exclude_patterns)
 
@@ -307,8 +317,6 @@ class _RuleExecutionService:
     ) -> list[LintViolation]:
         """Execute file-based rules."""
         del config  # Currently unused but part of interface
-        from .interfaces import FileBasedLintRule  # pylint: disable=import-outside-toplevel
-
         violations = []
         file_based_rules = [rule for rule in rules if isinstance(rule, FileBasedLintRule)]
 
@@ -321,9 +329,7 @@ class _RuleExecutionService:
         self, rules: list[LintRule], context: LintContext, config: dict[str, Any]
     ) -> list[LintViolation]:
         """Execute AST-based rules using visitor pattern."""
-        from .interfaces import ASTLintRule as ASTRule  # pylint: disable=import-outside-toplevel
-
-        ast_rules = [rule for rule in rules if isinstance(rule, ASTRule)]
+        ast_rules = [rule for rule in rules if isinstance(rule, ASTLintRule)]
 
         if not ast_rules or not context.ast_tree:
             return []
@@ -368,7 +374,21 @@ class DefaultLintOrchestrator(LintOrchestrator):
             logger.warning("No analyzer available for {}", file_path)
             return []
 
-        context = analyzer.analyze_file(file_path)
+        return self._lint_context(analyzer.analyze_file(file_path), config)
+
+    def lint_source(self, source: str, file_path: Path, config: dict[str, Any] | None = None) -> list[LintViolation]:
+        """Lint Python source held in memory as if it were the contents of file_path."""
+        config = config or self._get_default_config()
+
+        analyzer = self._get_analyzer_for_file(file_path)
+        if not isinstance(analyzer, PythonAnalyzer):
+            logger.warning("No in-memory analyzer available for {}", file_path)
+            return []
+
+        return self._lint_context(analyzer.analyze_source(source, file_path), config)
+
+    def _lint_context(self, context: LintContext, config: dict[str, Any]) -> list[LintViolation]:
+        """Run the enabled rules over an analyzed context."""
         if not self._should_analyze_context(context):
             return []
 
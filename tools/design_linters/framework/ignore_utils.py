@@ -34,10 +34,17 @@ IGNORE_PATTERNS = [
 # Specific rule ignore patterns (e.g., # design-lint: ignore[literals.magic-number])
 SPECIFIC_RULE_PATTERN = r"#\s*design-lint:\s*(?:ignore|disable)\[([^\]]+)\]"
 
+# Compiled once at import; these are matched against every scanned source line
+_IGNORE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in IGNORE_PATTERNS]
+_SPECIFIC_RULE_REGEX = re.compile(SPECIFIC_RULE_PATTERN, re.IGNORECASE)
+_IGNORE_NEXT_LINE_REGEX = re.compile(r"#\s*design-lint:\s*ignore-next-line", re.IGNORECASE)
+_IGNORE_FILE_REGEX = re.compile(r"#\s*design-lint:\s*ignore-file", re.IGNORECASE)
+_IGNORE_FILE_RULES_REGEX = re.compile(r"#\s*design-lint:\s*ignore-file\[([^\]]+)\]", re.IGNORECASE)
+
 
 def _has_general_ignore(line: str) -> bool:
     """Check if line has general ignore patterns."""
-    return any(re.search(pattern, line, re.IGNORECASE) for pattern in IGNORE_PATTERNS)
+    return any(regex.search(line) for regex in _IGNORE_REGEXES)
 
 
 def _rule_matches_ignore(rule_id: str, ignored_rule: str) -> bool:
@@ -50,7 +57,7 @@ def _rule_matches_ignore(rule_id: str, ignored_rule: str) -> bool:
 
 def _has_specific_rule_ignore(line: str, rule_id: str) -> bool:
     """Check if line has specific rule ignore for given rule_id."""
-    match = re.search(SPECIFIC_RULE_PATTERN, line, re.IGNORECASE)
+    match = _SPECIFIC_RULE_REGEX.search(line)
     if not match:
         return False
 
@@ -138,7 +145,7 @@ def extract_ignore_next_line_directives(file_content: str) -> set[int]:
 
     for i, line in enumerate(lines):
         # Check for "ignore next line" pattern
-        if not re.search(r"#\s*design-lint:\s*ignore-next-line", line, re.IGNORECASE):
+        if not _IGNORE_NEXT_LINE_REGEX.search(line):
             continue
 
         # Find the next non-empty line to ignore
@@ -184,14 +191,14 @@ def has_file_level_ignore(file_content: str, rule_id: str | None = None) -> bool
 
     for line in lines:
         # Check for file-level ignore pattern
-        if re.search(r"#\s*design-lint:\s*ignore-file", line, re.IGNORECASE):
+        if _IGNORE_FILE_REGEX.search(line):
             return True
 
         # Check for specific rule file-level ignore
         if not rule_id:
             continue
 
-        match = re.search(r"#\s*design-lint:\s*ignore-file\[([^\]]+)\]", line, re.IGNORECASE)
+        match = _IGNORE_FILE_RULES_REGEX.search(line)
         if not match:
             continue
 
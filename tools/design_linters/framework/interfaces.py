@@ -12,37 +12,54 @@ Overview: This module establishes the foundational interfaces that enable a plug
     dependency injection, and extensibility points. The module also includes ignore directive
     handling for suppressing specific violations, node stack tracking for context-aware analysis,
     and helper functions for creating consistent violation messages across all rules.
-Dependencies: abc for abstract base classes, typing for type hints, ast for AST nodes
+Dependencies: abc for abstract base classes, typing for type hints, ast for AST nodes, functools for caching
 Exports: LintRule, LintViolation, LintReporter, LintAnalyzer, LintOrchestrator
 Interfaces: All classes are abstract interfaces requiring implementation
 Implementation: Enables plugin architecture with dynamic rule loading
 """
 
 import ast
+import functools
 
 # Ignore functionality implementation - moved to top for proper imports
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+_IGNORE_FILE_DIRECTIVE = re.compile(r"# design-lint: ignore-file\[([^\]]+)\]")
+_IGNORE_LINE_DIRECTIVE = re.compile(r"# design-lint: ignore\[([^\]]+)\]")
 
-def has_file_level_ignore(file_content: str, rule_id: str) -> bool:
-    """Check if file has file-level ignore directive for given rule."""
-    lines = file_content.split("\n")
-    for line in lines[:10]:  # Check only first 10 lines
+
+@functools.lru_cache(maxsize=32)
+def _split_lines(file_content: str) -> tuple[str, ...]:
+    """Split file content into lines once and share the result across rules and nodes."""
+    return tuple(file_content.split("\n"))
+
+
+@functools.lru_cache(maxsize=32)
+def _file_ignore_patterns(file_content: str) -> tuple[str, ...]:
+    """Collect the ignore-file patterns from the file header once per content."""
+    patterns = []
+    for line in _split_lines(file_content)[:10]:  # Check only first 10 lines
         if "# design-lint: ignore-file[" in line:
             pattern = _extract_ignore_pattern(line, "ignore-file")
-            if pattern and _matches_rule_pattern(rule_id, pattern):
-                return True
-    return False
+            if pattern:
+                patterns.append(pattern)
+    return tuple(patterns)
+
+
+def has_file_level_ignore(file_content: str, rule_id: str) -> bool:
+    """Check if file has file-level ignore directive for given rule."""
+    return any(_matches_rule_pattern(rule_id, pattern) for pattern in _file_ignore_patterns(file_content))
 
 
 def should_ignore_violation(violation: "LintViolation", file_content: str) -> bool:
     """Check if a violation should be ignored based on inline directives."""
-    lines = file_content.split("\n")
+    lines = _split_lines(file_content)
 
     # Check line-level ignore on same line
     if violation.line <= len(lines):
@@ -64,9 +81,9 @@ def should_ignore_violation(violation: "LintViolation", file_content: str) -> bo
 def _extract_ignore_pattern(line: str, directive_type: str) -> str | None:
     """Extract ignore pattern from directive line."""
     if directive_type == "ignore-file":
-        match = re.search(r"# design-lint: ignore-file\[([^\]]+)\]", line)
+        match = _IGNORE_FILE_DIRECTIVE.search(line)
     elif directive_type == "ignore":
-        match = re.search(r"# design-lint: ignore\[([^\]]+)\]", line)
+        match = _IGNORE_LINE_DIRECTIVE.search(line)
     else:
         return None
 
@@ -93,7 +110,7 @@ def _matches_rule_pattern(rule_id: str, pattern: str) -> bool:
 
 def parse_ignore_directives(file_content: str, context: "LintContext") -> None:
     """Parse ignore directives from file content and populate context."""
-    lines = file_content.split("\n")
+    lines = _split_lines(file_content)
 
     for line_num, line in enumerate(lines, 1):
         _process_file_level_ignore(line_num, line, context)
@@ -134,14 +151,10 @@ def should_ignore_node(node: ast.AST, file_content: str, rule_id: str) -> bool:
         return False
 
     line_num = node.lineno
-    lines = file_content.split("\n")
-
-    # Check if line is in ignore_next_line set (previous line had ignore-next-line)
-    if line_num in {
-        line_num
-        for line_num in range(1, len(lines) + 1)
-        if line_num > 1 and "# design-lint: ignore-next-line" in lines[line_num - 2]
-    }:
+    lines = _split_lines(file_content)
+
+    # Check ignore-next-line directive on previous line
+    if 1 < line_num <= len(lines) and "# design-lint: ignore-next-line" in lines[line_num - 2]:
         return True
 
     # Check line-level ignore on same line
@@ -229,6 +242,10 @@ class LintRule(ABC):
         """Check for violations in the given context."""
         raise NotImplementedError("Subclasses must implement check")
 
+    def iter_violations(self, context: "LintContext") -> Iterator[LintViolation]:
+        """Yield violations lazily so callers can stop at the first one."""
+        yield from self.check(context)
+
     def is_enabled(self, config: dict[str, Any] | None) -> bool:
         """Check if this rule is enabled in the given configuration."""
         if config is None:
@@ -294,20 +311,39 @@ class _ASTRuleNodeVisitor(ast.NodeVisitor):
         update_context_for_node(self.context, node)
 
         try:
-            self._check_node_if_applicable(node)
+            if self._is_checkable(node):
+                self.violations.extend(self.rule.check_node(node, self.context))
             self.generic_visit(node)
         finally:
             self._restore_context_and_stack(node, old_function, old_class)
 
-    def _check_node_if_applicable(self, node: ast.AST) -> None:
-        """Check node if rule conditions are met."""
+    def iter_visit(self, node: ast.AST) -> Iterator[LintViolation]:
+        """Visit node and its children lazily, yielding violations as they are found."""
+        if self.context.node_stack is None:
+            raise RuntimeError("Node stack should be initialized")
+        self.context.node_stack.append(node)
+
+        old_function = self.context.current_function
+        old_class = self.context.current_class
+
+        update_context_for_node(self.context, node)
+
+        # The finally block also runs when a consumer stops iterating early
+        try:
+            if self._is_checkable(node):
+                yield from self.rule.check_node(node, self.context)
+            for child in ast.iter_child_nodes(node):
+                yield from self.iter_visit(child)
+        finally:
+            self._restore_context_and_stack(node, old_function, old_class)
+
+    def _is_checkable(self, node: ast.AST) -> bool:
+        """Check whether rule conditions are met for this node."""
         if not self.rule.should_check_node(node, self.context):
-            return
+            return False
         if not self.context.file_content:
-            return
-        if should_ignore_node(node, self.context.file_content, self.rule.rule_id):
-            return
-        self.violations.extend(self.rule.check_node(node, self.context))
+            return False
+        return not should_ignore_node(node, self.context.file_content, self.rule.rule_id)
 
     def _restore_context_and_stack(self, node: ast.AST, old_function: str | None, old_class: str | None) -> None:
         """Restore context stack and function/class tracking."""
@@ -332,23 +368,41 @@ class ASTLintRule(LintRule):
     def check(self, context: "LintContext") -> list[LintViolation]:
         """Default implementation that traverses AST and checks each node."""
         violations: list[LintViolation] = []
-
-        # Check for file-level ignore directives
-        if context.file_content and has_file_level_ignore(context.file_content, self.rule_id):
+        if not self._prepare_traversal(context):
             return violations
 
-        if not context.ast_tree:
-            return violations
-
-        # Initialize node stack if not already set
-        if context.node_stack is None:
-            context.node_stack = []
-
         # Use a visitor to maintain node stack
         visitor = _ASTRuleNodeVisitor(self, context)
         visitor.visit(context.ast_tree)
         return visitor.violations
 
+    def iter_violations(self, context: "LintContext") -> Iterator[LintViolation]:
+        """Traverse the AST lazily, yielding violations as each node is checked."""
+        # A subclass that replaces check() defines its own traversal, so that one is used
+        if type(self).check is not ASTLintRule.check:
+            yield from self.check(context)
+            return
+        if not self._prepare_traversal(context):
+            return
+
+        visitor = _ASTRuleNodeVisitor(self, context)
+        yield from visitor.iter_visit(context.ast_tree)
+
+    def _prepare_traversal(self, context: "LintContext") -> bool:
+        """Return whether the AST should be walked, initializing the node stack if so."""
+        # Nodes are only checked when source is available, so without it the walk is wasted
+        if not context.ast_tree or not context.file_content:
+            return False
+
+        # Check for file-level ignore directives
+        if has_file_level_ignore(context.file_content, self.rule_id):
+            return False
+
+        # Initialize node stack if not already set
+        if context.node_stack is None:
+            context.node_stack = []
+        return True
+
     def should_check_node(self, node: ast.AST, context: "LintContext") -> bool:  # pylint: disable=unused-argument
         """Determine if this node should be checked by this rule."""
         return True
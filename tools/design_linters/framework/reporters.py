@@ -26,6 +26,11 @@ from .interfaces import LintReporter, LintViolation, Severity
 # Configuration constants
 FILE_PATH_SEPARATOR_OFFSET = 3
 
+# json.dumps builds a new encoder whenever options are passed, so reporters share these instead
+_PRETTY_JSON_ENCODER = json.JSONEncoder(indent=2, default=str)
+_COMPACT_JSON_ENCODER = json.JSONEncoder(default=str)
+_SARIF_JSON_ENCODER = json.JSONEncoder(indent=2)
+
 # from datetime import datetime  # Future use
 # from pathlib import Path  # Future use
 
@@ -151,10 +156,7 @@ class TextReporter(LintReporter):
         """Group violations by file path."""
         groups: dict[str, list[LintViolation]] = {}
         for violation in violations:
-            file_path = violation.file_path
-            if file_path not in groups:
-                groups[file_path] = []
-            groups[file_path].append(violation)
+            groups.setdefault(violation.file_path, []).append(violation)
         return groups
 
     def _count_by_severity(self, violations: list[LintViolation]) -> dict[Severity, int]:
@@ -215,9 +217,8 @@ class JSONReporter(LintReporter):
             "violations": [v.to_dict() for v in violations],
         }
 
-        if self.pretty_print:
-            return json.dumps(report_data, indent=2, default=str)
-        return json.dumps(report_data, default=str)
+        encoder = _PRETTY_JSON_ENCODER if self.pretty_print else _COMPACT_JSON_ENCODER
+        return encoder.encode(report_data)
 
     def get_supported_formats(self) -> list[str]:
         """Get supported output formats."""
@@ -273,7 +274,7 @@ class SARIFReporter(LintReporter):
             ],
         }
 
-        return json.dumps(sarif_data, indent=2)
+        return _SARIF_JSON_ENCODER.encode(sarif_data)
 
     def get_supported_formats(self) -> list[str]:
         """Get supported output formats."""
@@ -359,19 +360,20 @@ class GitHubActionsReporter(LintReporter):
 class ReporterFactory:
     """Factory for creating appropriate reporters."""
 
+    # Built once with the class; create_reporter still returns a new reporter on every call
+    _FORMAT_MAP: dict[str, type[LintReporter]] = {
+        "text": TextReporter,
+        "txt": TextReporter,
+        "json": JSONReporter,
+        "sarif": SARIFReporter,
+        "github": GitHubActionsReporter,
+        "gh-actions": GitHubActionsReporter,
+    }
+
     @staticmethod
     def create_reporter(format_name: str, **kwargs: Any) -> LintReporter:
         """Create reporter for specified format."""
-        format_map = {
-            "text": TextReporter,
-            "txt": TextReporter,
-            "json": JSONReporter,
-            "sarif": SARIFReporter,
-            "github": GitHubActionsReporter,
-            "gh-actions": GitHubActionsReporter,
-        }
-
-        reporter_class = format_map.get(format_name.lower())
+        reporter_class = ReporterFactory._FORMAT_MAP.get(format_name.lower())
         if not reporter_class:
             raise ValueError(f"Unsupported format: {format_name}")
 
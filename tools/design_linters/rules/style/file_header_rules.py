@@ -41,6 +41,10 @@ class FileHeaderRule(ASTLintRule):
     # Recommended fields that generate warnings if missing
     RECOMMENDED_FIELDS = {"implementation"}
 
+    # Comment markers stripped from header continuation lines
+    LEADING_STAR_PATTERN = re.compile(r"^\*\s*")
+    LEADING_HASH_PATTERN = re.compile(r"^#\s*")
+
     # File type configurations for header extraction
     FILE_CONFIGS = {
         ".py": {
@@ -357,8 +361,8 @@ class FileHeaderRule(ASTLintRule):
             if current_field and line.strip():
                 cleaned_line = line.strip()
                 # Remove comment markers
-                cleaned_line = re.sub(r"^\*\s*", "", cleaned_line)
-                cleaned_line = re.sub(r"^#\s*", "", cleaned_line)
+                cleaned_line = self.LEADING_STAR_PATTERN.sub("", cleaned_line)
+                cleaned_line = self.LEADING_HASH_PATTERN.sub("", cleaned_line)
                 # Skip docstring delimiters
                 if (
                     cleaned_line